@@ -1,8 +1,10 @@
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import os
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -15,11 +17,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Finish deletes a previous run didn't get to
+    await asyncio.to_thread(empty_trash)
+    
+    # Start/stop the background task that batches job submissions
+    batcher = get_enqueue_batcher()
+    await batcher.start()
+    try:
+        yield
+    finally:
+        await batcher.stop()
+
 # Create FastAPI app
 app = FastAPI(
     title="Data Cleanser API",
     description="API for data cleaning and transformation",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS configuration
@@ -44,6 +61,8 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 
 # Import routes
 from app.routes import upload, preview, process, job
+from app.queue import get_enqueue_batcher
+from app.services.storage import empty_trash
 
 # Include routers
 app.include_router(upload.router)
@@ -51,11 +70,33 @@ app.include_router(preview.router)
 app.include_router(process.router)
 app.include_router(job.router)
 
-# Health check endpoint
-@app.get("/api/health")
+# Health check endpoint; the body is pre-encoded so pings skip serialization
+HEALTH_OK_BODY = b'{"status":"ok"}'
+
+@app.get("/api/health", response_class=Response)
 async def health_check():
-    return {"status": "ok"}
+    return Response(content=HEALTH_OK_BODY, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=9001, reload=True)
\ No newline at end of file
+    from app.queue import USING_REDIS
+    
+    # Reload only for local development; it can't be combined with workers
+    reload = os.getenv("RELOAD", "false").lower() == "true"
+    
+    # The in-memory queue and its job state live in one process, so only
+    # scale out to multiple workers when jobs go through Redis
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    if reload or not USING_REDIS:
+        workers = 1
+    
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=9001,
+        # uvloop and httptools when installed (uvloop has no Windows support)
+        loop="auto",
+        http="auto",
+        reload=reload,
+        workers=workers,
+    )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, TypeAdapter, validator
 from typing import List, Dict, Any, Optional, Union
 from enum import Enum
 import uuid
@@ -59,6 +59,10 @@ class OutlierAction(str, Enum):
     CAP = "cap"
     REMOVE = "remove"
 
+class NumericPrecision(str, Enum):
+    FLOAT64 = "float64"
+    FLOAT32 = "float32"
+
 class Transform(BaseModel):
     type: TransformType
     # Additional fields based on transform type
@@ -111,6 +115,7 @@ class ExportOptions(BaseModel):
     number_format: Optional[str] = None
     na_rep: Optional[str] = ""
     selected_columns: Optional[List[str]] = None
+    numeric_precision: Optional[NumericPrecision] = NumericPrecision.FLOAT64
     
 class UploadRequest(BaseModel):
     encoding: Optional[str] = "utf-8"
@@ -126,6 +131,37 @@ class ProcessRequest(BaseModel):
     rules: RuleSet
     export: ExportOptions
     
+# Built once at import; routes validate raw request bytes with these
+PREVIEW_REQUEST_ADAPTER = TypeAdapter(PreviewRequest)
+PROCESS_REQUEST_ADAPTER = TypeAdapter(ProcessRequest)
+
+def openapi_request_body(model: type) -> Dict[str, Any]:
+    """Build the OpenAPI requestBody for a route that validates its raw body itself
+    
+    Nested models are inlined, since their $defs aren't registered as
+    OpenAPI components.
+    """
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+    
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            node = {key: inline(value) for key, value in node.items()}
+            if "$ref" in node:
+                ref = node.pop("$ref")
+                return {**inline(defs[ref.rsplit("/", 1)[-1]]), **node}
+            return node
+        if isinstance(node, list):
+            return [inline(value) for value in node]
+        return node
+    
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": inline(schema)}},
+        }
+    }
+    
 class JobStatus(str, Enum):
     QUEUED = "queued"
     RUNNING = "running"
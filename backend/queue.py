@@ -1,6 +1,9 @@
 import redis
 import os
 import json
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Manager
 from rq import Queue
 from dotenv import load_dotenv
 import logging
@@ -9,6 +12,25 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+POOL_WORKERS = int(os.getenv("WORKERS", os.cpu_count() or 1))
+
+# Meta of the in-memory job running in this pool worker process
+_pool_job_meta = None
+
+def run_pool_job(meta, func, args, kwargs):
+    """Run an in-memory queue job inside a pool worker process"""
+    global _pool_job_meta
+    _pool_job_meta = meta
+    meta["status"] = "running"
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _pool_job_meta = None
+
+def get_pool_job_meta():
+    """Return the shared meta of the in-memory job running in this process"""
+    return _pool_job_meta
+
 # Try to connect to Redis, fallback to in-memory queue if Redis is unavailable
 try:
     # Connect to Redis
@@ -28,47 +50,50 @@ except Exception as e:
     class InMemoryQueue:
         def __init__(self):
             self.jobs = {}
+            # Bounded pool so CPU-bound jobs run in parallel interpreters
+            self.pool = ProcessPoolExecutor(max_workers=POOL_WORKERS)
+            # Shared dicts let pool workers report status and progress;
+            # the manager process is started on first enqueue
+            self.manager = None
         
         def enqueue(self, func, *args, **kwargs):
-            import threading
             import uuid
             
-            job_id = str(uuid.uuid4())
+            # Mirror rq's enqueue options instead of passing them to func
+            job_id = kwargs.pop("job_id", None) or str(uuid.uuid4())
+            kwargs.pop("result_ttl", None)
             
             # Create a simple job object
             class Job:
-                def __init__(self, id):
+                def __init__(self, id, meta):
                     self.id = id
-                    self.status = "queued"
-                    self.progress = 0
+                    self.meta = meta
                     self.result = None
                     self.error = None
                 
                 def get_status(self):
-                    return self.status
+                    return self.meta.get("status", "queued")
                 
                 def get_id(self):
                     return self.id
-                
-                def meta(self):
-                    return {"progress": self.progress}
-                
-            job = Job(job_id)
+            
+            if self.manager is None:
+                self.manager = Manager()
+            meta = self.manager.dict(status="queued", progress=0)
+            job = Job(job_id, meta)
             self.jobs[job_id] = job
             
-            # Run the job in a separate thread
-            def run_job():
+            # Run the job in the process pool
+            def on_done(future):
                 try:
-                    job.status = "running"
-                    result = func(*args, **kwargs)
-                    job.result = result
-                    job.status = "completed"
+                    job.result = future.result()
+                    job.meta["status"] = "completed"
                 except Exception as e:
                     job.error = str(e)
-                    job.status = "failed"
+                    job.meta["status"] = "failed"
             
-            thread = threading.Thread(target=run_job)
-            thread.start()
+            future = self.pool.submit(run_pool_job, meta, func, args, kwargs)
+            future.add_done_callback(on_done)
             
             return job
         
@@ -80,9 +105,99 @@ except Exception as e:
     
     USING_REDIS = False
 
+class EnqueueBatcher:
+    """Collect enqueue calls from concurrent requests and submit them together"""
+    
+    def __init__(self, queue, max_batch: int = 100, max_wait: float = 0.005):
+        self.queue = queue
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._pending = None
+        self._task = None
+    
+    async def start(self):
+        self._pending = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def enqueue(self, func, *args, **kwargs):
+        """Queue a job for the next batch and wait for it to be submitted"""
+        # Callers outside the app lifespan (tests, scripts) start it on first use
+        if self._task is None:
+            await self.start()
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._pending.put((func, args, kwargs, future))
+        return await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # Wait for the first request, then collect more for up to max_wait
+            batch = [await self._pending.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._pending.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                jobs = await asyncio.to_thread(self._submit, batch)
+            except Exception as e:
+                logger.error(f"Error enqueuing batch of {len(batch)} jobs: {e}")
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (*_, future), job in zip(batch, jobs):
+                if not future.done():
+                    future.set_result(job)
+    
+    def _submit(self, batch):
+        if not USING_REDIS:
+            return [
+                self.queue.enqueue(func, *args, **kwargs)
+                for func, args, kwargs, _ in batch
+            ]
+        
+        # Submit the whole batch in a single Redis pipeline
+        job_datas = []
+        for func, args, kwargs, _ in batch:
+            kwargs = dict(kwargs)
+            job_id = kwargs.pop("job_id", None)
+            result_ttl = kwargs.pop("result_ttl", None)
+            job_datas.append(
+                Queue.prepare_data(
+                    func,
+                    args=args,
+                    kwargs=kwargs,
+                    job_id=job_id,
+                    result_ttl=result_ttl,
+                )
+            )
+        return self.queue.enqueue_many(job_datas)
+
+enqueue_batcher = EnqueueBatcher(job_queue)
+
 def get_job_queue():
     return job_queue
 
+def get_enqueue_batcher():
+    return enqueue_batcher
+
 def get_job_status(job_id):
     job = job_queue.fetch_job(job_id)
     
@@ -94,11 +209,10 @@ def get_job_status(job_id):
     download_url = None
     error = None
     
-    if hasattr(job, "meta") and callable(job.meta):
-        meta = job.meta
-        if isinstance(meta, dict):
-            progress = meta.get("progress", 0)
-            download_url = meta.get("download_url")
+    meta = getattr(job, "meta", None)
+    if meta is not None and hasattr(meta, "get"):
+        progress = meta.get("progress", 0)
+        download_url = meta.get("download_url")
     
     if status == "failed" and hasattr(job, "error"):
         error = job.error
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from app.models import JobResponse, JobStatus
 from app.queue import get_job_status
 import os
@@ -20,19 +21,22 @@ async def get_job(job_id: str):
             detail="Job not found"
         )
     
-    # Create response
-    response = JobResponse(
-        job_id=job_id,
-        status=JobStatus(status["status"]),
-        progress=status["progress"],
-    )
+    # Fields come from our own queue, so the response skips JobResponse
+    # validation and is serialized directly
+    response = {
+        "job_id": job_id,
+        "status": JobStatus(status["status"]),
+        "progress": status["progress"],
+        "download_url": None,
+        "error": None,
+    }
     
     # Add download URL if completed
     if status["download_url"]:
-        response.download_url = f"{BACKEND_URL}/{status['download_url']}"
+        response["download_url"] = f"{BACKEND_URL}/{status['download_url']}"
     
     # Add error message if failed
     if status["error"]:
-        response.error = status["error"]
+        response["error"] = status["error"]
     
-    return response
\ No newline at end of file
+    return ORJSONResponse(response)
\ No newline at end of file
@@ -1,6 +1,10 @@
-from fastapi import APIRouter, HTTPException, Depends
-from app.models import PreviewRequest, PreviewResponse, ColumnInfo
-from app.services.transform import apply_rules_preview
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from fastapi.responses import ORJSONResponse
+from app.models import PREVIEW_REQUEST_ADAPTER, PreviewRequest, openapi_request_body, PreviewResponse
+from app.services.transform import apply_rules_preview, preview_to_arrow_stream, ARROW_STREAM_MEDIA_TYPE
+from app.services.storage import resolve_upload
 import os
 import logging
 
@@ -9,44 +13,58 @@ logger = logging.getLogger(__name__)
 
 TEMP_DIR = os.getenv("TEMP_DIR", "./tmp")
 
-@router.post("/preview", response_model=PreviewResponse)
-async def preview_data(request: PreviewRequest):
-    # Validate upload_id
-    upload_dir = os.path.join(TEMP_DIR, request.upload_id)
-    if not os.path.exists(upload_dir):
-        raise HTTPException(
-            status_code=404,
-            detail="Upload not found"
-        )
+@router.post(
+    "/preview",
+    response_model=PreviewResponse,
+    # The body is validated by hand below, so its schema is declared here
+    openapi_extra=openapi_request_body(PreviewRequest),
+)
+async def preview_data(http_request: Request):
+    # Validate the raw body in one pass with the prebuilt adapter, skipping
+    # the intermediate stdlib json.loads dict
+    try:
+        request = PREVIEW_REQUEST_ADAPTER.validate_json(await http_request.body())
+    except ValidationError as e:
+        # Locate errors under "body", as FastAPI's own body validation does
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])} for error in e.errors()
+        ])
     
-    # Find the uploaded file
-    files = os.listdir(upload_dir)
-    if not files:
+    # Resolve the uploaded file
+    file_path = resolve_upload(request.upload_id)
+    if not file_path:
         raise HTTPException(
             status_code=404,
-            detail="No files found in upload"
+            detail="Upload not found"
         )
     
-    file_path = os.path.join(upload_dir, files[0])
-    
     # Apply rules to preview data
     try:
-        preview_result = apply_rules_preview(file_path, request.rules)
+        # Clients can opt in to an Arrow IPC stream instead of JSON rows
+        wants_arrow = ARROW_STREAM_MEDIA_TYPE in http_request.headers.get("accept", "")
+        preview_result = apply_rules_preview(file_path, request.rules, as_arrow=wants_arrow)
         
-        # Convert to response model
+        if "table" in preview_result:
+            return Response(
+                content=preview_to_arrow_stream(preview_result),
+                media_type=ARROW_STREAM_MEDIA_TYPE
+            )
+        
+        # Rows are already JSON-safe, so serialize directly instead of
+        # re-validating them through PreviewResponse
         columns = [
-            ColumnInfo(
-                name=col["name"], 
-                inferred_type=col["inferredType"]
-            ) 
+            {
+                "name": col["name"],
+                "inferred_type": col["inferredType"]
+            }
             for col in preview_result["columns"]
         ]
         
-        return PreviewResponse(
-            columns=columns,
-            rows=preview_result["rows"],
-            warnings=preview_result.get("warnings", [])
-        )
+        return ORJSONResponse({
+            "columns": columns,
+            "rows": preview_result["rows"],
+            "warnings": preview_result.get("warnings", [])
+        })
     except Exception as e:
         logger.error(f"Error generating preview: {e}")
         raise HTTPException(
@@ -1,7 +1,11 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from app.models import ProcessRequest, ProcessResponse
-from app.queue import get_job_queue
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
+from app.models import PROCESS_REQUEST_ADAPTER, ProcessRequest, openapi_request_body, ProcessResponse
+from app.queue import get_enqueue_batcher
 from app.services.processor import process_file
+from app.services.storage import resolve_upload
 import os
 import uuid
 import logging
@@ -12,26 +16,31 @@ logger = logging.getLogger(__name__)
 TEMP_DIR = os.getenv("TEMP_DIR", "./tmp")
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:9001")
 
-@router.post("/process", response_model=ProcessResponse)
-async def process_data(request: ProcessRequest):
-    # Validate upload_id
-    upload_dir = os.path.join(TEMP_DIR, request.upload_id)
-    if not os.path.exists(upload_dir):
-        raise HTTPException(
-            status_code=404,
-            detail="Upload not found"
-        )
+@router.post(
+    "/process",
+    response_model=ProcessResponse,
+    # The body is validated by hand below, so its schema is declared here
+    openapi_extra=openapi_request_body(ProcessRequest),
+)
+async def process_data(http_request: Request):
+    # Validate the raw body in one pass with the prebuilt adapter, skipping
+    # the intermediate stdlib json.loads dict
+    try:
+        request = PROCESS_REQUEST_ADAPTER.validate_json(await http_request.body())
+    except ValidationError as e:
+        # Locate errors under "body", as FastAPI's own body validation does
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])} for error in e.errors()
+        ])
     
-    # Find the uploaded file
-    files = os.listdir(upload_dir)
-    if not files:
+    # Resolve the uploaded file
+    file_path = resolve_upload(request.upload_id)
+    if not file_path:
         raise HTTPException(
             status_code=404,
-            detail="No files found in upload"
+            detail="Upload not found"
         )
     
-    file_path = os.path.join(upload_dir, files[0])
-    
     # Create output directory
     output_dir = os.path.join(TEMP_DIR, request.upload_id, "output")
     os.makedirs(output_dir, exist_ok=True)
@@ -39,9 +48,8 @@ async def process_data(request: ProcessRequest):
     # Generate job_id
     job_id = str(uuid.uuid4())
     
-    # Enqueue the processing job
-    job_queue = get_job_queue()
-    job = job_queue.enqueue(
+    # Enqueue the processing job; concurrent requests share one submission
+    job = await get_enqueue_batcher().enqueue(
         process_file,
         file_path,
         request.rules,
@@ -52,4 +60,5 @@ async def process_data(request: ProcessRequest):
         job_id=job_id
     )
     
-    return ProcessResponse(job_id=job_id)
\ No newline at end of file
+    # Returned as a response so FastAPI doesn't re-validate it against ProcessResponse
+    return ORJSONResponse({"job_id": job_id})
\ No newline at end of file
@@ -1,18 +1,29 @@
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from app.models import UploadResponse, FileType
-from app.services.parser import detect_encoding, parse_sample
+from app.services.parser import detect_encoding, parse_sample, ENCODING_SAMPLE_SIZE
+from app.services.storage import register_upload, forget_upload, TRASH_DIR
 import os
 import uuid
 import shutil
 from typing import Optional
 import logging
-import chardet
+import aiofiles
+import anyio
 
 router = APIRouter(prefix="/api", tags=["upload"])
 logger = logging.getLogger(__name__)
 
 ALLOWED_EXTENSIONS = {".csv", ".xls", ".xlsx", ".tsv", ".txt"}
+EXT_TO_FILE_TYPE = {
+    ".csv": FileType.CSV,
+    ".xls": FileType.XLS,
+    ".xlsx": FileType.XLSX,
+    ".tsv": FileType.TSV,
+    ".txt": FileType.TXT,
+}
 MAX_FILE_SIZE = int(os.getenv("MAX_FILE_SIZE", "50000000"))  # 50MB
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
 TEMP_DIR = os.getenv("TEMP_DIR", "./tmp")
 
 @router.post("/upload", response_model=UploadResponse)
@@ -34,40 +45,42 @@ async def upload_file(
         )
     
     # Map extension to file type
-    file_type = FileType.CSV
-    if file_ext in [".xls", ".xlsx"]:
-        file_type = FileType.XLS if file_ext == ".xls" else FileType.XLSX
-    elif file_ext == ".tsv":
-        file_type = FileType.TSV
-    elif file_ext == ".txt":
-        file_type = FileType.TXT
+    file_type = EXT_TO_FILE_TYPE.get(file_ext, FileType.CSV)
     
-    # Check file size
+    # Create user directory if it doesn't exist
+    user_dir = os.path.join(TEMP_DIR, upload_id)
+    os.makedirs(user_dir, exist_ok=True)
+    
+    # Stream file to temporary location, enforcing the size limit per chunk
+    file_path = os.path.join(user_dir, file.filename)
     file_size = 0
-    contents = await file.read(MAX_FILE_SIZE + 1)
-    file_size = len(contents)
+    head = b""
+    async with aiofiles.open(file_path, "wb") as f:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > MAX_FILE_SIZE:
+                break
+            if len(head) < ENCODING_SAMPLE_SIZE:
+                head += chunk[:ENCODING_SAMPLE_SIZE - len(head)]
+            await f.write(chunk)
+    
+    # Check file size
     if file_size > MAX_FILE_SIZE:
+        await anyio.to_thread.run_sync(shutil.rmtree, user_dir, True)
         raise HTTPException(
             status_code=400,
             detail=f"File too large. Maximum size: {MAX_FILE_SIZE/1000000}MB"
         )
     
-    # Create user directory if it doesn't exist
-    user_dir = os.path.join(TEMP_DIR, upload_id)
-    os.makedirs(user_dir, exist_ok=True)
-    
-    # Save file to temporary location
-    file_path = os.path.join(user_dir, file.filename)
-    with open(file_path, "wb") as f:
-        f.write(contents)
+    register_upload(upload_id, file_path)
     
     # Detect encoding if not specified
     detected_encoding = None
     detected_delimiter = None
     
     if file_type in [FileType.CSV, FileType.TSV, FileType.TXT]:
-        # Read the first 10000 bytes to detect encoding
-        detection_result = detect_encoding(contents[:10000])
+        # Use the first bytes of the upload to detect encoding
+        detection_result = await anyio.to_thread.run_sync(detect_encoding, head)
         detected_encoding = detection_result.get("encoding")
         detected_delimiter = detection_result.get("delimiter")
     
@@ -75,8 +88,9 @@ async def upload_file(
     final_encoding = detected_encoding if detected_encoding else encoding
     final_delimiter = detected_delimiter if detected_delimiter else delimiter
     
-    # Parse sample (first 200 rows)
-    sample_data = parse_sample(
+    # Parse sample (first 200 rows) off the event loop
+    sample_data = await anyio.to_thread.run_sync(
+        parse_sample,
         file_path, 
         file_type, 
         final_encoding, 
@@ -84,18 +98,20 @@ async def upload_file(
         final_delimiter
     )
     
-    return UploadResponse(
-        upload_id=upload_id,
-        sample=sample_data,
-        detect={
+    # The sample rows are already JSON-safe, so serialize directly instead
+    # of re-validating them through UploadResponse
+    return ORJSONResponse({
+        "upload_id": upload_id,
+        "sample": sample_data,
+        "detect": {
             "encoding": final_encoding,
             "delimiter": final_delimiter,
         },
-        file_type=file_type,
-    )
+        "file_type": file_type,
+    })
 
 @router.delete("/upload/{upload_id}")
-async def delete_upload(upload_id: str):
+async def delete_upload(upload_id: str, background_tasks: BackgroundTasks):
     # Validate upload_id format to prevent directory traversal
     try:
         uuid.UUID(upload_id)
@@ -105,11 +121,16 @@ async def delete_upload(upload_id: str):
             detail="Invalid upload ID format"
         )
     
-    # Delete the upload directory
+    # Move the upload directory into the trash with a single rename, then
+    # delete it in the threadpool after the response is sent
+    forget_upload(upload_id)
     user_dir = os.path.join(TEMP_DIR, upload_id)
     if os.path.exists(user_dir):
         try:
-            shutil.rmtree(user_dir)
+            os.makedirs(TRASH_DIR, exist_ok=True)
+            trash_path = os.path.join(TRASH_DIR, upload_id)
+            os.rename(user_dir, trash_path)
+            background_tasks.add_task(shutil.rmtree, trash_path, True)
             return {"message": "Upload deleted successfully"}
         except Exception as e:
             logger.error(f"Error deleting upload {upload_id}: {e}")
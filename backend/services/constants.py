@@ -0,0 +1,13 @@
+# backend/app/services/constants.py
+import numpy as np
+from app.models import ExportOptions, NumericPrecision
+
+# Strings a BOOLEAN column treats as True; anything else, including missing values, is False
+BOOLEAN_TRUE_VALUES = frozenset({"true", "1", "yes", "y"})
+
+# Float dtypes FLOAT columns can be cast to, by ExportOptions.numeric_precision
+FLOAT_DTYPES = {NumericPrecision.FLOAT64: np.float64, NumericPrecision.FLOAT32: np.float32}
+
+def float_dtype_for(export_options: ExportOptions) -> type:
+    """Get the float dtype requested by the export options, float64 by default"""
+    return FLOAT_DTYPES[export_options.numeric_precision or NumericPrecision.FLOAT64]
@@ -1,33 +1,42 @@
 # backend/app/services/export.py
 import pandas as pd
 import numpy as np
+from openpyxl import Workbook
 import os
 import csv
 import json
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional
 from app.models import ExportOptions
 
 logger = logging.getLogger(__name__)
 
+PARQUET_ROW_GROUP_SIZE = 64 * 1024
+
+QUOTE_STYLES = {
+    "minimal": csv.QUOTE_MINIMAL,
+    "all": csv.QUOTE_ALL,
+    "nonnumeric": csv.QUOTE_NONNUMERIC,
+    "none": csv.QUOTE_NONE
+}
+
 def get_quote_style(style_str: str) -> int:
     """Convert string quote style to csv module constant"""
-    styles = {
-        "minimal": csv.QUOTE_MINIMAL,
-        "all": csv.QUOTE_ALL,
-        "nonnumeric": csv.QUOTE_NONNUMERIC,
-        "none": csv.QUOTE_NONE
-    }
-    
-    return styles.get(style_str.lower(), csv.QUOTE_MINIMAL)
+    return QUOTE_STYLES.get(style_str.lower(), csv.QUOTE_MINIMAL)
+
+def select_columns(df: pd.DataFrame, columns: Optional[List[str]]) -> pd.DataFrame:
+    """Select the requested columns that exist, in requested order; keep all if none exist"""
+    if not columns:
+        return df
+    valid_columns = pd.Index(columns).intersection(df.columns, sort=False)
+    if len(valid_columns):
+        df = df[valid_columns]
+    return df
 
 def format_dataframe(df: pd.DataFrame, options: ExportOptions) -> pd.DataFrame:
     """Format DataFrame based on export options before saving"""
     # Select columns if specified
-    if options.selected_columns:
-        valid_columns = [col for col in options.selected_columns if col in df.columns]
-        if valid_columns:
-            df = df[valid_columns]
+    df = select_columns(df, options.selected_columns)
     
     # Format date columns if date_format specified
     if options.date_format:
@@ -42,27 +51,35 @@ def format_dataframe(df: pd.DataFrame, options: ExportOptions) -> pd.DataFrame:
         for col in df.select_dtypes(include=['number']).columns:
             try:
                 # This is a simplified version - real implementation would be more complex
+                mask = df[col].isna()
                 if options.number_format == "comma":
-                    df[col] = df[col].apply(lambda x: f"{x:,}" if not pd.isna(x) else options.na_rep)
+                    # Group digits of the integer part only, keeping any decimals
+                    parts = df[col].astype("string").str.partition(".")
+                    integer = parts[0].str.replace(r"(\d)(?=(\d{3})+$)", r"\1,", regex=True)
+                    df[col] = (integer + parts[1] + parts[2]).mask(mask, options.na_rep)
                 elif options.number_format == "percent":
-                    df[col] = df[col].apply(lambda x: f"{x:.2%}" if not pd.isna(x) else options.na_rep)
+                    values = df[col].to_numpy(dtype=float, na_value=np.nan) * 100
+                    formatted = pd.Series(np.char.mod("%.2f%%", values), index=df.index)
+                    df[col] = formatted.mask(mask, options.na_rep)
                 # Add more number formats as needed
             except Exception as e:
                 logger.warning(f"Error formatting number column {col}: {e}")
     
     return df
 
-def export_to_csv(df: pd.DataFrame, output_path: str, options: ExportOptions) -> None:
-    """Export DataFrame to CSV"""
+def export_to_csv(df: pd.DataFrame, output_path: str, options: ExportOptions, append: bool = False) -> None:
+    """Export DataFrame to CSV; with append, add rows to an existing export without a header"""
     df = format_dataframe(df, options)
     
     df.to_csv(
         output_path,
+        mode="a" if append else "w",
+        header=not append,
         index=False,
         sep=options.delimiter or ",",
         encoding=options.encoding or "utf-8",
         quoting=get_quote_style(options.quote_style or "minimal"),
-        line_terminator=options.line_ending or "\n",
+        lineterminator=options.line_ending or "\n",
         na_rep=options.na_rep or ""
     )
 
@@ -70,31 +87,42 @@ def export_to_excel(df: pd.DataFrame, output_path: str, options: ExportOptions)
     """Export DataFrame to Excel"""
     df = format_dataframe(df, options)
     
-    with pd.ExcelWriter(output_path) as writer:
-        df.to_excel(
-            writer,
-            sheet_name=options.sheet_name or "Sheet1",
-            index=False,
-            na_rep=options.na_rep or ""
-        )
+    # Fill missing values up front so rows can be streamed as-is
+    na_value = options.na_rep or None
+    null_columns = df.columns[df.isna().any()]
+    if len(null_columns):
+        df = df.copy()
+        for col in null_columns:
+            df[col] = df[col].astype(object).where(df[col].notna(), na_value)
+    
+    # Write-only workbooks stream rows to the XML writer without a cell tree
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(options.sheet_name or "Sheet1")
+    ws.append([str(col) for col in df.columns])
+    for row in df.itertuples(index=False, name=None):
+        ws.append(row)
+    wb.save(output_path)
 
 def export_to_parquet(df: pd.DataFrame, output_path: str, options: ExportOptions) -> None:
     """Export DataFrame to Parquet"""
     # Select columns if specified
-    if options.selected_columns:
-        valid_columns = [col for col in options.selected_columns if col in df.columns]
-        if valid_columns:
-            df = df[valid_columns]
+    df = select_columns(df, options.selected_columns)
     
-    df.to_parquet(output_path, index=False)
+    # Snappy + dictionary encoding with bounded row groups
+    df.to_parquet(
+        output_path,
+        engine="pyarrow",
+        compression="snappy",
+        row_group_size=PARQUET_ROW_GROUP_SIZE,
+        use_dictionary=True,
+        write_statistics=False,
+        index=False
+    )
 
 def export_to_json(df: pd.DataFrame, output_path: str, options: ExportOptions) -> None:
     """Export DataFrame to JSON"""
     # Select columns if specified
-    if options.selected_columns:
-        valid_columns = [col for col in options.selected_columns if col in df.columns]
-        if valid_columns:
-            df = df[valid_columns]
+    df = select_columns(df, options.selected_columns)
     
     # Replace NaN with None for JSON compatibility
     df = df.replace({np.nan: None})
@@ -102,6 +130,30 @@ def export_to_json(df: pd.DataFrame, output_path: str, options: ExportOptions) -
     # Export to JSON (records format)
     df.to_json(output_path, orient="records", lines=True)
 
+# Formats that can be written chunk by chunk
+STREAMING_FORMATS = {"csv"}
+
+def export_chunks(chunks: Iterable[pd.DataFrame], options: ExportOptions, output_path: str) -> str:
+    """Export DataFrame chunks incrementally and return the file path"""
+    format = options.format.lower()
+    if format not in STREAMING_FORMATS:
+        raise ValueError(f"Format does not support chunked export: {format}")
+    
+    file_name = f"cleaned_data.{format}"
+    full_path = os.path.join(output_path, file_name)
+    
+    written = False
+    for chunk in chunks:
+        export_to_csv(chunk, full_path, options, append=written)
+        written = True
+    
+    # Still produce a file when the input had no rows
+    if not written:
+        export_to_csv(pd.DataFrame(), full_path, options)
+    
+    # Return relative path for download URL
+    return f"tmp/{os.path.basename(os.path.dirname(output_path))}/output/{file_name}"
+
 def export_data(df: pd.DataFrame, options: ExportOptions, output_path: str) -> str:
     """Export data to specified format and return the file path"""
     format = options.format.lower()
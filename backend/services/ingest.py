@@ -0,0 +1,118 @@
+# backend/app/services/ingest.py
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import os
+from typing import Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Ingested columns are Arrow-backed strings, so .str ops run on Arrow kernels
+STRING_DTYPE = "string[pyarrow]"
+
+# Strings pandas' read_csv treats as missing by default
+NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+]
+
+EXCEL_EXTENSIONS = {".xls", ".xlsx"}
+
+def string_types_mapper(arrow_type: pa.DataType) -> Optional[pd.api.extensions.ExtensionDtype]:
+    """Map Arrow strings to pandas' Arrow-backed string dtype"""
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pd.StringDtype("pyarrow")
+    return None
+
+def skip_long_rows(row: pacsv.InvalidRow) -> str:
+    """Skip rows with extra fields, as pandas' on_bad_lines="skip" does
+    
+    Rows missing fields raise instead, so callers re-read the file with
+    pandas, which keeps them and pads them with missing values.
+    """
+    return "skip" if row.actual_columns > row.expected_columns else "error"
+
+def read_excel(file_path: str, nrows: Optional[int] = None) -> pd.DataFrame:
+    """Read the first sheet of a workbook, with calamine when it is installed"""
+    try:
+        return pd.read_excel(file_path, dtype=STRING_DTYPE, nrows=nrows, engine="calamine")
+    except (ImportError, ValueError) as e:
+        logger.warning(f"Calamine Excel reader unavailable, falling back to openpyxl: {e}")
+    return pd.read_excel(file_path, dtype=STRING_DTYPE, nrows=nrows)
+
+def read_csv(
+    file_path: str,
+    delimiter: Optional[str] = None,
+    encoding: Optional[str] = None,
+    nrows: Optional[int] = None
+) -> pd.DataFrame:
+    """Read a delimited file with every column as strings, using Arrow's multithreaded reader"""
+    read_options = pacsv.ReadOptions(encoding=encoding or "utf-8")
+    parse_options = pacsv.ParseOptions(
+        delimiter=delimiter or ",",
+        invalid_row_handler=skip_long_rows,
+    )
+    
+    # The header is read first so every column can be typed as a string
+    with pacsv.open_csv(file_path, read_options=read_options, parse_options=parse_options) as header_reader:
+        column_names = header_reader.schema.names
+    convert_options = pacsv.ConvertOptions(
+        column_types={name: pa.string() for name in column_names},
+        null_values=NA_VALUES,
+        strings_can_be_null=True,
+    )
+    
+    if nrows is None:
+        table = pacsv.read_csv(
+            file_path,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        )
+    else:
+        # Stream only as many blocks as the requested rows need
+        with pacsv.open_csv(
+            file_path,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        ) as reader:
+            batches = []
+            rows = 0
+            for batch in reader:
+                batches.append(batch)
+                rows += batch.num_rows
+                if rows >= nrows:
+                    break
+            table = pa.Table.from_batches(batches, schema=reader.schema).slice(0, nrows)
+    
+    return table.to_pandas(types_mapper=string_types_mapper)
+
+def read_data(
+    file_path: str,
+    delimiter: Optional[str] = None,
+    encoding: Optional[str] = None,
+    nrows: Optional[int] = None
+) -> pd.DataFrame:
+    """Read an uploaded CSV or Excel file with every column as Arrow-backed strings"""
+    file_ext = os.path.splitext(file_path)[1].lower()
+    
+    if file_ext in EXCEL_EXTENSIONS:
+        return read_excel(file_path, nrows=nrows)
+    
+    try:
+        return read_csv(file_path, delimiter=delimiter, encoding=encoding, nrows=nrows)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+        logger.warning(f"Arrow CSV read failed, falling back to pandas: {e}")
+    
+    return pd.read_csv(
+        file_path,
+        delimiter=delimiter or ",",
+        encoding=encoding or "utf-8",
+        dtype=STRING_DTYPE,
+        nrows=nrows,
+        on_bad_lines='skip',
+        low_memory=False
+    )
@@ -0,0 +1,65 @@
+# backend/app/services/numeric.py
+import numpy as np
+from typing import Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Numba is optional; fall back to NumPy kernels when it isn't installed
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def nan_mean_std(values: np.ndarray) -> Tuple[float, float]:
+        """Mean and sample std (ddof=1) of the non-NaN values, in one Welford pass"""
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for i in range(values.shape[0]):
+            value = values[i]
+            if np.isnan(value):
+                continue
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+        
+        if count == 0:
+            return np.nan, np.nan
+        if count == 1:
+            return mean, np.nan
+        return mean, np.sqrt(m2 / (count - 1))
+    
+    @njit(cache=True, parallel=True)
+    def clip_to_bounds(values: np.ndarray, lower: float, upper: float, remove: bool) -> np.ndarray:
+        """Cap values to [lower, upper], or set them to NaN when remove is set"""
+        out = np.empty_like(values)
+        for i in prange(values.shape[0]):
+            value = values[i]
+            if value < lower:
+                out[i] = np.nan if remove else lower
+            elif value > upper:
+                out[i] = np.nan if remove else upper
+            else:
+                out[i] = value
+        return out
+else:
+    def nan_mean_std(values: np.ndarray) -> Tuple[float, float]:
+        """Mean and sample std (ddof=1) of the non-NaN values"""
+        valid = values[~np.isnan(values)]
+        if len(valid) == 0:
+            return np.nan, np.nan
+        if len(valid) == 1:
+            return float(valid[0]), np.nan
+        return float(valid.mean()), float(valid.std(ddof=1))
+    
+    def clip_to_bounds(values: np.ndarray, lower: float, upper: float, remove: bool) -> np.ndarray:
+        """Cap values to [lower, upper], or set them to NaN when remove is set"""
+        outside = (values < lower) | (values > upper)
+        if remove:
+            return np.where(outside, np.nan, values)
+        return np.where(values < lower, lower, np.where(values > upper, upper, values))
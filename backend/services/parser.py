@@ -1,37 +1,43 @@
 import pandas as pd
-import numpy as np
-import chardet
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import orjson
+import codecs
 import csv
 import os
 import io
+import datetime
 from app.models import ColumnDType, FileType
+from app.services.ingest import NA_VALUES, skip_long_rows
 from typing import Dict, List, Any, Optional
+from charset_normalizer import from_bytes
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Bytes inspected for encoding detection; accuracy flattens well before this
+ENCODING_SAMPLE_SIZE = 4096
+
 def detect_encoding(content: bytes) -> Dict[str, str]:
     """Detect encoding and delimiter from file content"""
     result = {"encoding": "utf-8", "delimiter": ","}
     
-    # Detect encoding
-    detection = chardet.detect(content)
-    if detection and detection["confidence"] > 0.7:
-        result["encoding"] = detection["encoding"]
-    
-    # Detect delimiter
+    # Detect encoding, trying UTF-8 first since it covers most uploads.
+    # The incremental decoder tolerates a multi-byte char cut at the end.
+    sample = content[:ENCODING_SAMPLE_SIZE]
     try:
-        content_str = content.decode(result["encoding"], errors="replace")
-        # Try to guess delimiter by checking for common ones
-        delimiters = [",", ";", "\t", "|"]
-        max_count = 0
-        for delim in delimiters:
-            count = content_str.count(delim)
-            if count > max_count:
-                max_count = count
-                result["delimiter"] = delim
-    except Exception as e:
-        logger.warning(f"Error detecting delimiter: {e}")
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        best = from_bytes(sample).best()
+        result["encoding"] = best.encoding if best else "latin-1"
+    
+    # Detect delimiter by counting candidates in the raw header line; they
+    # are all ASCII, so no decode is needed
+    head = content.split(b"\n", 1)[0]
+    counts = {delim: head.count(delim) for delim in (b",", b";", b"\t", b"|")}
+    best_delimiter = max(counts, key=counts.get)
+    if counts[best_delimiter] > 0:
+        result["delimiter"] = best_delimiter.decode()
     
     return result
 
@@ -58,40 +64,169 @@ def infer_column_type(series: pd.Series) -> ColumnDType:
     if pd.api.types.is_float_dtype(non_null):
         return ColumnDType.FLOAT
     
-    # Check if date
-    try:
-        pd.to_datetime(non_null, errors='raise')
-        # Check if time component is present
-        sample = pd.to_datetime(non_null.iloc[0])
-        if sample.time() == pd.Timestamp('00:00:00').time():
-            return ColumnDType.DATE
+    # Check if date on a bounded probe; coerce instead of raising
+    probe = non_null.iloc[:32]
+    parsed = pd.to_datetime(probe, errors="coerce")
+    if parsed.notna().all():
+        # Check if time component is present; mixed UTC offsets come back
+        # as an object series of datetimes, without the .dt accessor
+        if pd.api.types.is_datetime64_any_dtype(parsed):
+            has_time = (parsed.dt.normalize() != parsed).any()
         else:
+            has_time = any(value.time() != datetime.time.min for value in parsed)
+        if has_time:
             return ColumnDType.DATETIME
-    except:
-        pass
+        return ColumnDType.DATE
     
     # Check if categorical (less than 10 unique values)
     if len(non_null.unique()) < 10 and len(non_null) > 20:
         return ColumnDType.CATEGORY
     
-    # Check if JSON (sample a few values)
-    import json
-    sample_size = min(5, len(non_null))
-    json_count = 0
-    for val in non_null.sample(sample_size):
+    # Check if JSON (probe the first few values)
+    probe = non_null.iloc[:5].astype(str)
+    if probe.str.match(r"^[\[{]").all():
         try:
-            if isinstance(val, str) and (val.startswith('{') or val.startswith('[')):
-                json.loads(val)
-                json_count += 1
-        except:
+            for val in probe:
+                orjson.loads(val)
+            return ColumnDType.JSON
+        except orjson.JSONDecodeError:
             pass
     
-    if json_count == sample_size:
-        return ColumnDType.JSON
-    
     # Default to string
     return ColumnDType.STRING
 
+def infer_column_types(df: pd.DataFrame) -> Dict[str, ColumnDType]:
+    """Infer the data types of all DataFrame columns, dispatching on dtypes first"""
+    all_null = df.isna().all()
+    column_types = {}
+    object_columns = []
+    
+    # Numeric and boolean columns are typed by the reader already
+    for col, dtype in df.dtypes.items():
+        if all_null[col]:
+            column_types[col] = ColumnDType.STRING
+        elif pd.api.types.is_bool_dtype(dtype):
+            column_types[col] = ColumnDType.BOOLEAN
+        elif pd.api.types.is_integer_dtype(dtype):
+            column_types[col] = ColumnDType.INTEGER
+        elif pd.api.types.is_float_dtype(dtype):
+            column_types[col] = ColumnDType.FLOAT
+        else:
+            object_columns.append(col)
+    
+    # Only the remaining columns need the value-based date/JSON probes
+    for col in object_columns:
+        column_types[col] = infer_column_type(df[col])
+    
+    return column_types
+
+def json_default(value: Any) -> Any:
+    """Fallback serializer for values orjson does not handle natively"""
+    if pd.isna(value):
+        return None
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+def to_json_rows(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Normalize records to JSON-safe values (NaN/NaT become None) in one orjson pass"""
+    return orjson.loads(
+        orjson.dumps(
+            records,
+            default=json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    )
+
+def to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert a small frame to JSON-ready records, with missing values as None
+    
+    Datetimes become datetime objects, which orjson serializes natively, so
+    the records don't need an extra serialization round trip.
+    """
+    records = df.astype(object)
+    for column in df.select_dtypes(include=["datetime", "datetimetz"]).columns:
+        records[column] = pd.Series(df[column].dt.to_pydatetime(), index=df.index, dtype=object)
+    return records.where(df.notna(), None).to_dict("records")
+
+def arrow_type_to_dtype(arrow_type: pa.DataType) -> Optional[ColumnDType]:
+    """Map an Arrow type inferred by the CSV reader to a column type"""
+    if pa.types.is_boolean(arrow_type):
+        return ColumnDType.BOOLEAN
+    if pa.types.is_integer(arrow_type):
+        return ColumnDType.INTEGER
+    if pa.types.is_floating(arrow_type):
+        return ColumnDType.FLOAT
+    if pa.types.is_date(arrow_type):
+        return ColumnDType.DATE
+    if pa.types.is_timestamp(arrow_type):
+        return ColumnDType.DATETIME
+    
+    # Strings and nulls still need value-based inference
+    return None
+
+def read_csv_sample(
+    file_path: str,
+    sample_rows: int,
+    encoding: str = "utf-8",
+    has_header: bool = True,
+    delimiter: Optional[str] = None
+) -> pa.Table:
+    """Read the first rows of a delimited file as a single Arrow record batch
+    
+    Files with rows missing fields are re-read with pandas, which pads those
+    rows like the job's reader does.
+    """
+    try:
+        return read_csv_sample_arrow(file_path, sample_rows, encoding, has_header, delimiter)
+    except pa.ArrowInvalid as e:
+        logger.warning(f"Arrow CSV sample read failed, falling back to pandas: {e}")
+    
+    df = pd.read_csv(
+        file_path,
+        encoding=encoding,
+        header=0 if has_header else None,
+        delimiter=delimiter or ",",
+        nrows=sample_rows,
+        on_bad_lines='skip',
+        low_memory=False
+    )
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+def read_csv_sample_arrow(
+    file_path: str,
+    sample_rows: int,
+    encoding: str,
+    has_header: bool,
+    delimiter: Optional[str]
+) -> pa.Table:
+    """Read the first rows of a delimited file with Arrow's streaming reader"""
+    reader = pacsv.open_csv(
+        file_path,
+        read_options=pacsv.ReadOptions(
+            block_size=1 << 20,
+            encoding=encoding,
+            autogenerate_column_names=not has_header,
+        ),
+        parse_options=pacsv.ParseOptions(
+            delimiter=delimiter or ",",
+            invalid_row_handler=skip_long_rows,
+        ),
+        convert_options=pacsv.ConvertOptions(
+            # Same missing value markers as the job's reader
+            null_values=NA_VALUES,
+            strings_can_be_null=True,
+        ),
+    )
+    
+    # Only the first block is needed for the sample
+    try:
+        batch = reader.read_next_batch()
+    except StopIteration:
+        return reader.schema.empty_table()
+    
+    return pa.Table.from_batches([batch]).slice(0, sample_rows)
+
 def parse_sample(
     file_path: str, 
     file_type: FileType,
@@ -110,34 +245,49 @@ def parse_sample(
                 header=0 if has_header else None,
                 nrows=sample_rows
             )
+            
+            # If no header, create default column names
+            if not has_header:
+                df.columns = [f"Column_{i+1}" for i in range(len(df.columns))]
+            
+            # Infer column types
+            column_types = infer_column_types(df)
+            
+            # Convert DataFrame to list of dictionaries for JSON response
+            rows = to_records(df)
+            column_names = list(df.columns)
         else:
             # Parse CSV/TSV/TXT file
-            df = pd.read_csv(
+            table = read_csv_sample(
                 file_path,
+                sample_rows,
                 encoding=encoding,
-                header=0 if has_header else None,
-                delimiter=delimiter,
-                nrows=sample_rows,
-                on_bad_lines='skip',
-                low_memory=False
+                has_header=has_header,
+                delimiter=delimiter
             )
-        
-        # If no header, create default column names
-        if not has_header:
-            df.columns = [f"Column_{i+1}" for i in range(len(df.columns))]
-        
-        # Infer column types
-        column_types = {}
-        for col in df.columns:
-            column_types[col] = infer_column_type(df[col])
-        
-        # Convert DataFrame to list of dictionaries for JSON response
-        rows = df.replace({np.nan: None}).to_dict('records')
+            
+            # If no header, create default column names
+            if not has_header:
+                table = table.rename_columns(
+                    [f"Column_{i+1}" for i in range(table.num_columns)]
+                )
+            
+            # Use the Arrow schema for typed columns, infer the rest from values
+            column_types = {}
+            for field, column in zip(table.schema, table.columns):
+                column_types[field.name] = (
+                    arrow_type_to_dtype(field.type)
+                    or infer_column_type(column.to_pandas())
+                )
+            
+            # Arrow nulls already map to None
+            rows = to_json_rows(table.to_pylist())
+            column_names = table.column_names
         
         # Prepare column info
         columns = [
             {"name": col, "inferredType": column_types[col]}
-            for col in df.columns
+            for col in column_names
         ]
         
         return {
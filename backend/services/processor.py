@@ -1,35 +1,96 @@
 # backend/app/services/processor.py
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 import os
 import time
 import json
-from typing import Dict, Any, List, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 import logging
-from app.models import RuleSet, ExportOptions, ColumnDType, ImputeStrategy, TransformType, OutlierMethod, OutlierAction
+from app.models import RuleSet, ExportOptions, ColumnRule, ColumnDType, Impute, Transform, ImputeStrategy, TransformType, OutlierMethod, OutlierAction
 from app.services.parser import infer_column_type
-from app.services.validate import validate_column
-from app.services.export import export_data
+from app.services.validate import validate_column, dtype_kinds, re2_matches_like_re, NUMERIC_KINDS
+from app.services.ingest import read_data, STRING_DTYPE
+from app.services.export import export_data, export_chunks, STREAMING_FORMATS
+from app.services.numeric import nan_mean_std, clip_to_bounds
+from app.services.processor_polars import can_process_with_polars, apply_rules_polars
+from app.services.constants import BOOLEAN_TRUE_VALUES, float_dtype_for
+from app.queue import get_pool_job_meta
 from rq import get_current_job
 
 logger = logging.getLogger(__name__)
 
+# Threads applying column rules concurrently
+RULE_THREADS = max(1, int(os.getenv("RULE_THREADS", str(min(8, os.cpu_count() or 1)))))
+
+# Second hash key used to verify rows dropped as duplicates
+DEDUP_CHECK_KEY = "cleansela-dedup1"
+
+# Minimum seconds between progress writes, each of which is a Redis round trip
+PROGRESS_INTERVAL = float(os.getenv("PROGRESS_INTERVAL", "0.25"))
+_last_progress_update = [0.0]
+
+# Rows per chunk when streaming CSVs through the rule pipeline
+CHUNK_ROWS = int(os.getenv("PROCESS_CHUNK_ROWS", "100000"))
+
+# Imputation strategies that only look at the row being filled
+ROW_LOCAL_IMPUTE = {ImputeStrategy.NONE, ImputeStrategy.VALUE}
+
+def rule_option(rule: Any, key: str, default: Any = None) -> Any:
+    """Read an option from a rule model, or from its dict form"""
+    if isinstance(rule, dict):
+        return rule.get(key, default)
+    return getattr(rule, key, default)
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a transform regex once and reuse it across columns and files"""
+    return re.compile(pattern)
+
 def update_progress(progress: float):
-    """Update job progress"""
+    """Update job progress, at most once per PROGRESS_INTERVAL seconds until done"""
+    now = time.monotonic()
+    if progress < 1.0 and now - _last_progress_update[0] < PROGRESS_INTERVAL:
+        return
+    # A finished job resets the gate so the next job's first update goes through
+    _last_progress_update[0] = 0.0 if progress >= 1.0 else now
+    
     job = get_current_job()
     if job:
         job.meta["progress"] = progress
         job.save_meta()
+    else:
+        # In-memory queue jobs report through the shared pool meta
+        meta = get_pool_job_meta()
+        if meta is not None:
+            meta["progress"] = progress
+
+def string_values(series: pd.Series) -> pd.Series:
+    """Get a series as Arrow strings, casting only when it isn't one already
+    
+    Object columns are cast too, so TRIM/LOWER/UPPER/TITLE run on Arrow's
+    compiled UTF-8 kernels instead of per-element Python str methods. After
+    the first cast, chained string transforms reuse the same buffers.
+    """
+    if series.dtype == STRING_DTYPE:
+        return series
+    return series.astype(STRING_DTYPE)
 
-def apply_dtype(df: pd.DataFrame, column: str, dtype: ColumnDType) -> pd.DataFrame:
-    """Apply data type to column"""
+def apply_dtype(df: pd.DataFrame, column: str, dtype: ColumnDType, float_dtype: type = np.float64) -> pd.DataFrame:
+    """Apply data type to column; FLOAT columns are stored as float_dtype"""
     try:
         if dtype == ColumnDType.INTEGER:
             df[column] = pd.to_numeric(df[column], errors="coerce").fillna(0).astype(int)
         elif dtype == ColumnDType.FLOAT:
-            df[column] = pd.to_numeric(df[column], errors="coerce")
+            # to_numeric gives Arrow strings nullable Int64/Float64; a numpy
+            # float column takes any imputed value, whole or not
+            df[column] = pd.to_numeric(df[column], errors="coerce").astype(float_dtype)
         elif dtype == ColumnDType.BOOLEAN:
-            df[column] = df[column].astype(str).map({"true": True, "false": False, "1": True, "0": False, "yes": True, "no": False, "y": True, "n": False}).fillna(False)
+            # Anything outside the true set, including missing values, is False
+            df[column] = df[column].astype("string").isin(BOOLEAN_TRUE_VALUES)
         elif dtype == ColumnDType.DATE:
             df[column] = pd.to_datetime(df[column], errors="coerce").dt.date
         elif dtype == ColumnDType.DATETIME:
@@ -40,15 +101,16 @@ def apply_dtype(df: pd.DataFrame, column: str, dtype: ColumnDType) -> pd.DataFra
             # Keep as string, but could validate JSON
             pass
         else:  # String
-            df[column] = df[column].astype(str)
+            if not isinstance(df[column].dtype, pd.StringDtype):
+                df[column] = df[column].astype(str)
     except Exception as e:
         logger.warning(f"Error applying dtype {dtype} to column {column}: {e}")
     
     return df
 
-def apply_imputation(df: pd.DataFrame, column: str, impute: Dict[str, Any]) -> pd.DataFrame:
+def apply_imputation(df: pd.DataFrame, column: str, impute: Union[Impute, Dict[str, Any]]) -> pd.DataFrame:
     """Apply imputation to column"""
-    strategy = impute.get("strategy", ImputeStrategy.NONE)
+    strategy = rule_option(impute, "strategy", ImputeStrategy.NONE)
     
     if strategy == ImputeStrategy.NONE:
         return df
@@ -60,14 +122,17 @@ def apply_imputation(df: pd.DataFrame, column: str, impute: Dict[str, Any]) -> p
     
     # Apply imputation based on strategy
     if strategy == ImputeStrategy.VALUE:
-        value = impute.get("value")
+        value = rule_option(impute, "value")
         if value is not None:
+            # Arrow string columns only accept string values
+            if isinstance(df[column].dtype, pd.StringDtype):
+                value = str(value)
             df.loc[mask, column] = value
     elif strategy == ImputeStrategy.MEAN:
-        if pd.api.types.is_numeric_dtype(df[column]):
+        if df[column].dtype.kind in NUMERIC_KINDS:
             df.loc[mask, column] = df[column].mean()
     elif strategy == ImputeStrategy.MEDIAN:
-        if pd.api.types.is_numeric_dtype(df[column]):
+        if df[column].dtype.kind in NUMERIC_KINDS:
             df.loc[mask, column] = df[column].median()
     elif strategy == ImputeStrategy.MODE:
         mode_value = df[column].mode()
@@ -80,72 +145,187 @@ def apply_imputation(df: pd.DataFrame, column: str, impute: Dict[str, Any]) -> p
     
     return df
 
-def apply_transform(df: pd.DataFrame, column: str, transform: Dict[str, Any]) -> pd.DataFrame:
+def apply_transform(df: pd.DataFrame, column: str, transform: Union[Transform, Dict[str, Any]]) -> pd.DataFrame:
     """Apply transform to column"""
-    transform_type = transform.get("type")
+    transform_type = rule_option(transform, "type")
     
     try:
         if transform_type == TransformType.TRIM:
-            df[column] = df[column].astype(str).str.strip()
+            df[column] = string_values(df[column]).str.strip()
         
         elif transform_type == TransformType.LOWER:
-            df[column] = df[column].astype(str).str.lower()
+            df[column] = string_values(df[column]).str.lower()
         
         elif transform_type == TransformType.UPPER:
-            df[column] = df[column].astype(str).str.upper()
+            df[column] = string_values(df[column]).str.upper()
         
         elif transform_type == TransformType.TITLE:
-            df[column] = df[column].astype(str).str.title()
+            df[column] = string_values(df[column]).str.title()
         
         elif transform_type == TransformType.REPLACE:
-            pattern = transform.get("pattern", "")
-            replacement = transform.get("replacement", "")
-            df[column] = df[column].astype(str).str.replace(pattern, replacement, regex=True)
+            pattern = rule_option(transform, "pattern", "")
+            replacement = rule_option(transform, "replacement", "")
+            values = string_values(df[column])
+            replaced = None
+            if values.dtype == STRING_DTYPE and re2_matches_like_re(pattern):
+                # A string pattern lets Arrow strings use the RE2 kernel
+                try:
+                    replaced = values.str.replace(pattern, replacement, regex=True)
+                except pa.ArrowInvalid:
+                    pass  # Syntax RE2 doesn't support, e.g. lookarounds
+            if replaced is None:
+                replaced = values.str.replace(compile_pattern(pattern), replacement, regex=True)
+            df[column] = replaced
         
         elif transform_type == TransformType.EXTRACT:
-            pattern = transform.get("pattern", "")
-            df[column] = df[column].astype(str).str.extract(f"({pattern})", expand=False)
+            pattern = rule_option(transform, "pattern", "")
+            df[column] = string_values(df[column]).str.extract(compile_pattern(f"({pattern})"), expand=False)
         
         elif transform_type == TransformType.PARSE_DATE:
-            format = transform.get("format", "%Y-%m-%d")
-            timezone = transform.get("timezone")
-            df[column] = pd.to_datetime(df[column], format=format, errors="coerce")
+            format = rule_option(transform, "format", "%Y-%m-%d")
+            timezone = rule_option(transform, "timezone")
+            # A None format lets pandas infer it; explicit formats match exactly
+            df[column] = pd.to_datetime(df[column], format=format, errors="coerce", cache=True)
             if timezone:
-                df[column] = df[column].dt.tz_localize("UTC").dt.tz_convert(timezone)
+                if df[column].dt.tz is None:
+                    df[column] = df[column].dt.tz_localize("UTC")
+                df[column] = df[column].dt.tz_convert(timezone)
         
         elif transform_type == TransformType.PARSE_NUMBER:
-            locale = transform.get("locale")
+            locale = rule_option(transform, "locale")
             if locale:
                 # This is simplified; real implementation would handle locale-specific formatting
-                df[column] = df[column].astype(str).str.replace(",", ".")
-            df[column] = pd.to_numeric(df[column], errors="coerce")
+                df[column] = string_values(df[column]).str.replace(",", ".")
+            df[column] = pd.to_numeric(df[column], errors="coerce").astype(np.float64)
         
         elif transform_type == TransformType.MAP_VALUES:
-            mapping = transform.get("mapping", {})
-            df[column] = df[column].map(mapping).fillna(df[column])
+            # Entries mapping to None leave the value unchanged
+            mapping = {k: v for k, v in (rule_option(transform, "mapping", {}) or {}).items() if v is not None}
+            if mapping:
+                keys = list(mapping.keys())
+                values = np.empty(len(mapping), dtype=object)
+                values[:] = list(mapping.values())
+                
+                # Categorical codes index the replacements; -1 marks unmapped values
+                codes = pd.Categorical(df[column], categories=keys).codes
+                original = df[column].to_numpy(dtype=object)
+                df[column] = np.where(codes == -1, original, values[codes.clip(min=0)])
         
         elif transform_type == TransformType.SPLIT:
-            delimiter = transform.get("delimiter", ",")
+            delimiter = rule_option(transform, "delimiter", ",")
             # This creates a new column with the split result
             # In a real app, we'd need to handle this more carefully
             new_column = f"{column}_split"
-            df[new_column] = df[column].astype(str).str.split(delimiter)
+            df[new_column] = string_values(df[column]).str.split(delimiter)
         
         elif transform_type == TransformType.JOIN:
-            delimiter = transform.get("delimiter", " ")
-            # This assumes the column contains lists
-            df[column] = df[column].apply(
-                lambda x: delimiter.join(x) if isinstance(x, list) else x
-            )
+            delimiter = rule_option(transform, "delimiter", " ")
+            # Only object columns can hold lists (e.g. from a prior SPLIT);
+            # join those rows with the vectorized .str.join
+            if df[column].dtype == object:
+                is_list = df[column].map(type).eq(list)
+                if is_list.all():
+                    df[column] = df[column].str.join(delimiter)
+                elif is_list.any():
+                    df.loc[is_list, column] = df.loc[is_list, column].str.join(delimiter)
     
     except Exception as e:
         logger.warning(f"Error applying transform {transform_type} to column {column}: {e}")
     
     return df
 
-def apply_validation(df: pd.DataFrame, column: str, validation: Dict[str, Any]) -> List[str]:
+def apply_column_rule(column_df: pd.DataFrame, column_rule: ColumnRule, float_dtype: type = np.float64) -> pd.DataFrame:
+    """Apply a column's dtype, imputation and transforms to a frame holding just that column"""
+    column_name = column_rule.name
+    
+    # Apply data type
+    column_df = apply_dtype(column_df, column_name, column_rule.dtype, float_dtype)
+    
+    # Apply imputation
+    if column_rule.impute:
+        column_df = apply_imputation(column_df, column_name, column_rule.impute)
+    
+    # Apply transformations
+    if column_rule.transforms:
+        for transform in column_rule.transforms:
+            column_df = apply_transform(column_df, column_name, transform)
+    
+    return column_df
+
+def columns_created_by(column_rule: ColumnRule) -> List[str]:
+    """Get the names of the columns a rule's transforms add to the frame"""
+    return [
+        f"{column_rule.name}_split"
+        for transform in column_rule.transforms or []
+        if rule_option(transform, "type") == TransformType.SPLIT
+    ]
+
+def column_frame(df: pd.DataFrame, column: str, updates: Dict[str, pd.Series]) -> pd.DataFrame:
+    """Get a standalone single-column frame, seeing any pending update to the column"""
+    if column in updates:
+        return updates[column].to_frame(column)
+    return df[[column]].copy()
+
+def apply_column_rules(
+    df: pd.DataFrame,
+    rules: RuleSet,
+    progress_range: Optional[Tuple[float, float]] = None,
+    float_dtype: type = np.float64
+) -> pd.DataFrame:
+    """Apply all column rules, merging the results back with a single assign
+    
+    Columns are independent, so each column's rules run in order on a thread
+    pool; the pandas and Arrow kernels doing the work release the GIL. Rules
+    on columns created by an earlier rule (e.g. SPLIT's <col>_split) run
+    afterwards, in order, once the created columns exist.
+    """
+    # Group rules by column so repeated rules for a column still apply in order
+    column_rules: Dict[str, List[ColumnRule]] = {}
+    created_column_rules: List[ColumnRule] = []
+    created_columns = set()
+    for column_rule in rules.columns:
+        if column_rule.name in df.columns:
+            column_rules.setdefault(column_rule.name, []).append(column_rule)
+        elif column_rule.name in created_columns:
+            created_column_rules.append(column_rule)
+        else:
+            continue
+        created_columns.update(columns_created_by(column_rule))
+    
+    if not column_rules:
+        return df
+    
+    def process_column(column_name: str) -> pd.DataFrame:
+        column_df = df[[column_name]].copy()
+        for column_rule in column_rules[column_name]:
+            column_df = apply_column_rule(column_df, column_rule, float_dtype)
+        return column_df
+    
+    updates = {}
+    with ThreadPoolExecutor(max_workers=min(RULE_THREADS, len(column_rules))) as executor:
+        for i, column_df in enumerate(executor.map(process_column, column_rules)):
+            updates.update(column_df.items())
+            
+            # Progress update per column
+            if progress_range:
+                start, end = progress_range
+                update_progress(start + (end - start) * (i + 1) / len(column_rules))
+    
+    df = df.assign(**updates)
+    for column_rule in created_column_rules:
+        column_df = apply_column_rule(df[[column_rule.name]].copy(), column_rule, float_dtype)
+        df = df.assign(**dict(column_df.items()))
+    
+    return df
+
+def apply_validation(
+    df: pd.DataFrame,
+    column: str,
+    validation: Dict[str, Any],
+    kinds: Optional[Dict[str, str]] = None
+) -> List[str]:
     """Apply validation to column and return warnings"""
-    return validate_column(df, column, validation)
+    return validate_column(df, column, validation, kinds)
 
 def apply_outlier_detection(df: pd.DataFrame, outliers: Dict[str, Any]) -> pd.DataFrame:
     """Apply outlier detection and handling"""
@@ -153,41 +333,45 @@ def apply_outlier_detection(df: pd.DataFrame, outliers: Dict[str, Any]) -> pd.Da
     columns = outliers.get("columns", [])
     action = outliers.get("action", OutlierAction.CAP)
     
-    for column in columns:
-        if column not in df.columns or not pd.api.types.is_numeric_dtype(df[column]):
+    kinds = dtype_kinds(df)
+    for column in pd.Index(columns).intersection(df.columns, sort=False):
+        if kinds[column] not in NUMERIC_KINDS:
             continue
         
         try:
+            # float32 columns stay float32, halving the bytes the kernels stream
+            values_dtype = np.float32 if df[column].dtype == np.float32 else np.float64
+            values = df[column].to_numpy(dtype=values_dtype, na_value=np.nan)
+            
             # IQR method
             if method == OutlierMethod.IQR:
-                Q1 = df[column].quantile(0.25)
-                Q3 = df[column].quantile(0.75)
+                Q1, Q3 = np.nanquantile(values, [0.25, 0.75])
                 IQR = Q3 - Q1
                 lower_bound = Q1 - 1.5 * IQR
                 upper_bound = Q3 + 1.5 * IQR
-                
-                if action == OutlierAction.CAP:
-                    # Cap outliers to bounds
-                    df[column] = df[column].clip(lower=lower_bound, upper=upper_bound)
-                elif action == OutlierAction.REMOVE:
-                    # Mark outliers as NaN
-                    mask = (df[column] < lower_bound) | (df[column] > upper_bound)
-                    df.loc[mask, column] = np.nan
             
-            # Z-score method
+            # Z-score method: values with |z| > 3 are outliers
             elif method == OutlierMethod.ZSCORE:
-                mean = df[column].mean()
-                std = df[column].std()
-                z_scores = (df[column] - mean) / std
-                
-                if action == OutlierAction.CAP:
-                    # Cap values with |z| > 3
-                    df.loc[z_scores > 3, column] = mean + 3 * std
-                    df.loc[z_scores < -3, column] = mean - 3 * std
-                elif action == OutlierAction.REMOVE:
-                    # Mark outliers as NaN
-                    mask = abs(z_scores) > 3
-                    df.loc[mask, column] = np.nan
+                mean, std = nan_mean_std(values)
+                lower_bound = mean - 3 * std
+                upper_bound = mean + 3 * std
+            
+            else:
+                continue
+            
+            # Integer columns are capped to whole bounds inside the float ones,
+            # so the capped values can keep the column's dtype
+            keep_integers = kinds[column] in "iu" and action != OutlierAction.REMOVE
+            if keep_integers:
+                lower_bound, upper_bound = np.ceil(lower_bound), np.floor(upper_bound)
+            
+            # Cap outliers to bounds, or mark them as NaN
+            capped = clip_to_bounds(
+                values, lower_bound, upper_bound, action == OutlierAction.REMOVE
+            )
+            if keep_integers:
+                capped = pd.Series(capped, index=df.index).astype(df[column].dtype)
+            df[column] = capped
         
         except Exception as e:
             logger.warning(f"Error applying outlier detection to column {column}: {e}")
@@ -202,13 +386,105 @@ def apply_deduplication(df: pd.DataFrame, deduplicate: Dict[str, Any]) -> pd.Dat
         return df
     
     # Ensure all columns in subset exist
-    valid_subset = [col for col in subset if col in df.columns]
+    valid_subset = list(pd.Index(subset).intersection(df.columns, sort=False))
     
     if not valid_subset:
         return df
     
-    # Remove duplicates
-    return df.drop_duplicates(subset=valid_subset, keep="first")
+    # Remove duplicates: keep the first row for each hash of the subset values
+    subset_df = df[valid_subset]
+    try:
+        hashes = pd.util.hash_pandas_object(subset_df, index=False).to_numpy()
+    except TypeError:
+        # Unhashable values, e.g. lists from a SPLIT
+        return df.drop_duplicates(subset=valid_subset, keep="first")
+    
+    _, first_rows, inverse = np.unique(hashes, return_index=True, return_inverse=True)
+    keep = np.zeros(len(df), dtype=bool)
+    keep[first_rows] = True
+    
+    # Rehash dropped rows and the rows they matched with a second key to rule out collisions
+    dropped = np.flatnonzero(~keep)
+    if len(dropped):
+        matched = first_rows[inverse.ravel()[dropped]]
+        check_dropped = pd.util.hash_pandas_object(subset_df.iloc[dropped], index=False, hash_key=DEDUP_CHECK_KEY)
+        check_matched = pd.util.hash_pandas_object(subset_df.iloc[matched], index=False, hash_key=DEDUP_CHECK_KEY)
+        if not np.array_equal(check_dropped.to_numpy(), check_matched.to_numpy()):
+            logger.warning("Hash collision during deduplication, falling back to drop_duplicates")
+            return df.drop_duplicates(subset=valid_subset, keep="first")
+    
+    return df.iloc[np.flatnonzero(keep)]
+
+def can_process_in_chunks(file_path: str, rules: RuleSet, export_options: ExportOptions) -> bool:
+    """Check whether a file can be streamed through the rules chunk by chunk
+    
+    Deduplication, outlier detection and column-wide imputation need the
+    whole file, so rule sets using them are processed in one frame. So are
+    rules whose result depends on the values seen together: to_datetime
+    infers its format from the first value, and pandas writes datetimes
+    without a time when every value is midnight.
+    """
+    file_ext = os.path.splitext(file_path)[1].lower()
+    if file_ext in [".xls", ".xlsx"]:
+        return False
+    
+    if export_options.format.lower() not in STREAMING_FORMATS:
+        return False
+    
+    if rules.deduplicate or rules.outliers:
+        return False
+    
+    for column_rule in rules.columns:
+        if column_rule.impute and column_rule.impute.strategy not in ROW_LOCAL_IMPUTE:
+            return False
+        
+        # Inferred date formats can differ from chunk to chunk
+        if column_rule.dtype in (ColumnDType.DATE, ColumnDType.DATETIME):
+            return False
+        
+        for transform in column_rule.transforms or []:
+            transform_type = rule_option(transform, "type")
+            # Parsed dates need both a parse format and an export format
+            if transform_type == TransformType.PARSE_DATE and not (
+                rule_option(transform, "format") and export_options.date_format
+            ):
+                return False
+    
+    return True
+
+def estimate_row_count(file_path: str) -> int:
+    """Estimate the number of rows from the file size and the first 64KB"""
+    with open(file_path, "rb") as f:
+        head = f.read(1 << 16)
+    if not head:
+        return 1
+    return max(1, int(os.path.getsize(file_path) * head.count(b"\n") / len(head)))
+
+def process_chunks(
+    file_path: str,
+    rules: RuleSet,
+    export_options: ExportOptions,
+    progress_range: Optional[Tuple[float, float]] = None
+) -> Iterator[pd.DataFrame]:
+    """Read a CSV in chunks and yield each chunk with the column rules applied"""
+    reader = pd.read_csv(
+        file_path,
+        delimiter=export_options.delimiter or ",",
+        encoding=export_options.encoding or "utf-8",
+        dtype=STRING_DTYPE,
+        on_bad_lines='skip',
+        chunksize=CHUNK_ROWS
+    )
+    total_chunks = max(1, -(-estimate_row_count(file_path) // CHUNK_ROWS))
+    
+    with reader:
+        for i, chunk in enumerate(reader):
+            yield apply_column_rules(chunk, rules, float_dtype=float_dtype_for(export_options))
+            
+            # Progress update per chunk
+            if progress_range:
+                start, end = progress_range
+                update_progress(start + (end - start) * min(1.0, (i + 1) / total_chunks))
 
 def process_file(
     file_path: str, 
@@ -224,63 +500,48 @@ def process_file(
         # Update job status
         update_progress(0.1)
         
-        # Read the file
-        file_ext = os.path.splitext(file_path)[1].lower()
-        
-        if file_ext in [".xls", ".xlsx"]:
-            df = pd.read_excel(file_path, dtype=str)
-        else:
-            df = pd.read_csv(
-                file_path,
-                delimiter=export_options.delimiter or ",",
-                encoding=export_options.encoding or "utf-8",
-                dtype=str,
-                on_bad_lines='skip',
-                low_memory=False
-            )
+        output_dir = os.path.join(os.path.dirname(file_path), "output")
+        os.makedirs(output_dir, exist_ok=True)
         
-        # Update job status
-        update_progress(0.2)
+        # Large CSVs run as a single Polars lazy query
+        df = None
+        if can_process_with_polars(file_path, rules, export_options):
+            try:
+                df = apply_rules_polars(file_path, rules, export_options)
+            except Exception as e:
+                logger.warning(f"Polars pipeline failed, falling back to pandas: {e}")
         
-        # Apply data types
-        for i, column_rule in enumerate(rules.columns):
-            column_name = column_rule.name
-            
-            if column_name not in df.columns:
-                continue
-            
-            # Apply data type
-            df = apply_dtype(df, column_name, column_rule.dtype)
-            
-            # Apply imputation
-            if column_rule.impute:
-                df = apply_imputation(df, column_name, column_rule.impute.dict())
+        if df is None and can_process_in_chunks(file_path, rules, export_options):
+            # Stream the file through the rules and into the export chunk by chunk
+            chunks = process_chunks(file_path, rules, export_options, progress_range=(0.2, 0.9))
+            download_path = export_chunks(chunks, export_options, output_dir)
+        else:
+            if df is None:
+                # Read the file
+                df = read_data(
+                    file_path,
+                    delimiter=export_options.delimiter,
+                    encoding=export_options.encoding
+                )
+                
+                # Update job status
+                update_progress(0.2)
+                
+                df = apply_column_rules(df, rules, progress_range=(0.2, 0.7), float_dtype=float_dtype_for(export_options))
+                
+                # Apply deduplicate
+                if rules.deduplicate:
+                    df = apply_deduplication(df, rules.deduplicate)
+                
+                # Apply outlier detection
+                if rules.outliers:
+                    df = apply_outlier_detection(df, rules.outliers.dict())
             
-            # Apply transformations
-            if column_rule.transforms:
-                for transform in column_rule.transforms:
-                    df = apply_transform(df, column_name, transform.dict())
+            # Update job status
+            update_progress(0.8)
             
-            # Progress update per column
-            progress = 0.2 + (0.5 * (i + 1) / len(rules.columns))
-            update_progress(progress)
-        
-        # Apply deduplicate
-        if rules.deduplicate:
-            df = apply_deduplication(df, rules.deduplicate)
-        
-        # Apply outlier detection
-        if rules.outliers:
-            df = apply_outlier_detection(df, rules.outliers.dict())
-        
-        # Update job status
-        update_progress(0.8)
-        
-        # Export data
-        output_dir = os.path.join(os.path.dirname(file_path), "output")
-        os.makedirs(output_dir, exist_ok=True)
-        
-        download_path = export_data(df, export_options, output_dir)
+            # Export data
+            download_path = export_data(df, export_options, output_dir)
         
         # Update job status
         update_progress(1.0)
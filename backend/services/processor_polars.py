@@ -0,0 +1,444 @@
+# backend/app/services/processor_polars.py
+import polars as pl
+import pandas as pd
+import numpy as np
+import os
+import re
+from typing import Dict, Any, List, Optional, Tuple
+import logging
+from app.models import (
+    RuleSet,
+    ExportOptions,
+    ColumnRule,
+    ColumnDType,
+    ImputeStrategy,
+    TransformType,
+    OutlierMethod,
+    OutlierAction,
+    ValidationType,
+)
+from app.services.ingest import NA_VALUES, EXCEL_EXTENSIONS
+from app.services.constants import BOOLEAN_TRUE_VALUES, float_dtype_for
+
+logger = logging.getLogger(__name__)
+
+# Files at least this large (~200k rows) go through the Polars pipeline
+POLARS_MIN_FILE_SIZE = int(os.getenv("POLARS_MIN_FILE_SIZE", "20000000"))  # 20MB
+
+# Transforms with a Polars expression equivalent
+SUPPORTED_TRANSFORMS = {
+    TransformType.TRIM,
+    TransformType.LOWER,
+    TransformType.UPPER,
+    TransformType.TITLE,
+    TransformType.REPLACE,
+    TransformType.EXTRACT,
+    TransformType.PARSE_DATE,
+    TransformType.PARSE_NUMBER,
+    TransformType.MAP_VALUES,
+}
+
+# Data types whose pandas result depends on the whole column (DATE/DATETIME
+# infer one format from the first value), which Polars expressions can't match
+COLUMN_WIDE_DTYPES = {ColumnDType.DATE, ColumnDType.DATETIME}
+
+NUMERIC_DTYPES = {ColumnDType.INTEGER, ColumnDType.FLOAT}
+
+# Polars equivalents of the float dtypes FLOAT columns can be cast to
+POLARS_FLOAT_TYPES = {np.float64: pl.Float64, np.float32: pl.Float32}
+
+def can_process_with_polars(file_path: str, rules: RuleSet, export_options: ExportOptions) -> bool:
+    """Check whether a file and rule set should go through the Polars pipeline"""
+    if not file_supported_by_polars(file_path, export_options.encoding):
+        return False
+    
+    return rules_supported_by_polars(rules)
+
+def file_supported_by_polars(file_path: str, encoding: Optional[str] = None) -> bool:
+    """Check whether a file is a CSV large enough for the Polars pipeline"""
+    file_ext = os.path.splitext(file_path)[1].lower()
+    if file_ext in EXCEL_EXTENSIONS:
+        return False
+    
+    if os.path.getsize(file_path) < POLARS_MIN_FILE_SIZE:
+        return False
+    
+    # Polars only reads UTF-8
+    encoding = (encoding or "utf-8").lower().replace("_", "-")
+    return encoding in ("utf-8", "utf8")
+
+def polars_float_type(export_options: ExportOptions) -> pl.DataType:
+    """Get the Polars float type requested by the export options"""
+    return POLARS_FLOAT_TYPES[float_dtype_for(export_options)]
+
+def rules_supported_by_polars(rules: RuleSet) -> bool:
+    """Check whether every rule in a rule set has a Polars expression matching the pandas result"""
+    for column_rule in rules.columns:
+        if column_rule.dtype in COLUMN_WIDE_DTYPES:
+            return False
+        
+        for transform in column_rule.transforms or []:
+            if transform.type not in SUPPORTED_TRANSFORMS:
+                return False
+            # Polars can't infer date formats the way pandas does
+            if transform.type == TransformType.PARSE_DATE and not transform.format:
+                return False
+            # pandas keeps non-string mapped values as they are; replace()
+            # would cast them to strings
+            if transform.type == TransformType.MAP_VALUES and any(
+                value is not None and not isinstance(value, str)
+                for value in (transform.mapping or {}).values()
+            ):
+                return False
+    
+    return True
+
+def dtype_expr(expr: pl.Expr, dtype: ColumnDType, float_type: pl.DataType = pl.Float64) -> pl.Expr:
+    """Build the expression applying a data type; FLOAT columns are cast to float_type"""
+    if dtype == ColumnDType.INTEGER:
+        # pandas' to_numeric ignores surrounding whitespace
+        return expr.str.strip_chars().cast(pl.Float64, strict=False).fill_nan(0).fill_null(0).cast(pl.Int64)
+    elif dtype == ColumnDType.FLOAT:
+        return expr.str.strip_chars().cast(float_type, strict=False)
+    elif dtype == ColumnDType.BOOLEAN:
+        return expr.is_in(list(BOOLEAN_TRUE_VALUES)).fill_null(False)
+    elif dtype == ColumnDType.DATE:
+        return expr.str.to_date(strict=False)
+    elif dtype == ColumnDType.DATETIME:
+        return expr.str.to_datetime(strict=False)
+    elif dtype == ColumnDType.CATEGORY:
+        return expr.cast(pl.Categorical)
+    
+    # String and JSON columns are read as strings already
+    return expr
+
+def impute_expr(expr: pl.Expr, column_rule: ColumnRule) -> pl.Expr:
+    """Build the expression applying imputation"""
+    impute = column_rule.impute
+    strategy = impute.strategy
+    
+    if strategy == ImputeStrategy.VALUE:
+        if impute.value is not None:
+            return expr.fill_null(pl.lit(impute.value))
+    elif strategy in (ImputeStrategy.MEAN, ImputeStrategy.MEDIAN):
+        if column_rule.dtype in NUMERIC_DTYPES:
+            fill = expr.mean() if strategy == ImputeStrategy.MEAN else expr.median()
+            expr = expr.fill_null(fill)
+            # The float statistic would otherwise promote INTEGER columns
+            if column_rule.dtype == ColumnDType.INTEGER:
+                expr = expr.cast(pl.Int64)
+            return expr
+    elif strategy == ImputeStrategy.MODE:
+        return expr.fill_null(expr.drop_nulls().mode().first())
+    elif strategy == ImputeStrategy.FORWARD_FILL:
+        return expr.forward_fill()
+    elif strategy == ImputeStrategy.BACKWARD_FILL:
+        return expr.backward_fill()
+    
+    return expr
+
+def transform_expr(expr: pl.Expr, transform: Any) -> pl.Expr:
+    """Build the expression applying a transform"""
+    transform_type = transform.type
+    
+    if transform_type == TransformType.TRIM:
+        return expr.cast(pl.Utf8).str.strip_chars()
+    
+    elif transform_type == TransformType.LOWER:
+        return expr.cast(pl.Utf8).str.to_lowercase()
+    
+    elif transform_type == TransformType.UPPER:
+        return expr.cast(pl.Utf8).str.to_uppercase()
+    
+    elif transform_type == TransformType.TITLE:
+        return expr.cast(pl.Utf8).str.to_titlecase()
+    
+    elif transform_type == TransformType.REPLACE:
+        # Polars uses ${1} for group references where pandas uses \1, so
+        # literal dollar signs are escaped first
+        replacement = (transform.replacement or "").replace("$", "$$")
+        replacement = re.sub(r"\\(\d+)", r"${\1}", replacement)
+        return expr.cast(pl.Utf8).str.replace_all(transform.pattern or "", replacement)
+    
+    elif transform_type == TransformType.EXTRACT:
+        return expr.cast(pl.Utf8).str.extract(f"({transform.pattern or ''})", 1)
+    
+    elif transform_type == TransformType.PARSE_DATE:
+        expr = expr.cast(pl.Utf8).str.to_datetime(transform.format, strict=False)
+        if transform.timezone:
+            expr = expr.dt.replace_time_zone("UTC").dt.convert_time_zone(transform.timezone)
+        return expr
+    
+    elif transform_type == TransformType.PARSE_NUMBER:
+        expr = expr.cast(pl.Utf8)
+        if transform.locale:
+            # This is simplified; real implementation would handle locale-specific formatting
+            expr = expr.str.replace_all(",", ".", literal=True)
+        return expr.str.strip_chars().cast(pl.Float64, strict=False)
+    
+    elif transform_type == TransformType.MAP_VALUES:
+        # Unmapped values, and entries mapping to None, are kept as-is
+        mapping = {k: v for k, v in (transform.mapping or {}).items() if v is not None}
+        return expr.replace(mapping) if mapping else expr
+    
+    return expr
+
+def outlier_expr(column: str, method: OutlierMethod, action: OutlierAction, dtype: pl.DataType) -> pl.Expr:
+    """Build the expression applying outlier detection to a numeric column"""
+    col = pl.col(column)
+    
+    if method == OutlierMethod.IQR:
+        q1 = col.quantile(0.25, interpolation="linear")
+        q3 = col.quantile(0.75, interpolation="linear")
+        lower_bound = q1 - 1.5 * (q3 - q1)
+        upper_bound = q3 + 1.5 * (q3 - q1)
+    else:
+        mean = col.mean()
+        std = col.std()
+        lower_bound = mean - 3 * std
+        upper_bound = mean + 3 * std
+    
+    if action == OutlierAction.REMOVE:
+        # Mark outliers as null
+        return (
+            pl.when((col < lower_bound) | (col > upper_bound))
+            .then(None)
+            .otherwise(col)
+            .alias(column)
+        )
+    
+    # Integer columns are capped to whole bounds and keep their dtype, as in pandas
+    if dtype.is_integer():
+        lower_bound, upper_bound = lower_bound.ceil(), upper_bound.floor()
+    
+    # Cap outliers to bounds
+    capped = (
+        pl.when(col < lower_bound).then(lower_bound)
+        .when(col > upper_bound).then(upper_bound)
+        .otherwise(col)
+    )
+    if dtype.is_integer():
+        capped = capped.cast(dtype)
+    return capped.alias(column)
+
+def validation_exprs(column: str, validation: Dict[str, Any], dtype: pl.DataType, key: str) -> List[pl.Expr]:
+    """Build the expressions computing a validation's stats, aliased under key"""
+    validation_type = validation.get("type")
+    col = pl.col(column)
+    
+    if validation_type == ValidationType.REQUIRED:
+        return [col.is_null().sum().alias(key)]
+    
+    elif validation_type == ValidationType.UNIQUE:
+        return [(pl.len() - col.n_unique()).alias(key)]
+    
+    elif validation_type in (ValidationType.MIN, ValidationType.MAX):
+        value = validation.get("value")
+        if value is None or not dtype.is_numeric():
+            return []
+        mask = col < value if validation_type == ValidationType.MIN else col > value
+        return [mask.sum().alias(key)]
+    
+    elif validation_type == ValidationType.REGEX:
+        # Anchored like pandas' str.match; missing values don't match
+        pattern = f"^(?:{validation.get('pattern') or ''})"
+        return [(~col.cast(pl.Utf8).str.contains(pattern).fill_null(False)).sum().alias(key)]
+    
+    elif validation_type == ValidationType.ALLOWED_SET:
+        allowed = validation.get("allowed") or []
+        if not allowed:
+            return []
+        invalid = ~col.is_in(allowed).fill_null(False)
+        return [
+            invalid.sum().alias(key),
+            col.filter(invalid).unique(maintain_order=True).head(5).implode().alias(f"{key}__values"),
+        ]
+    
+    elif validation_type == ValidationType.DATE_RANGE:
+        if dtype != pl.Datetime:
+            return []
+        exprs = []
+        for bound, op in (("min", col.__lt__), ("max", col.__gt__)):
+            if validation.get(bound):
+                try:
+                    value = pd.to_datetime(validation[bound]).to_pydatetime()
+                except Exception:
+                    continue
+                exprs.append(op(value).sum().alias(f"{key}__{bound}"))
+        return exprs
+    
+    return []
+
+def validation_warnings(
+    column: str,
+    validation: Dict[str, Any],
+    dtype: pl.DataType,
+    stats: Dict[str, Any],
+    key: str
+) -> List[str]:
+    """Format a validation's warnings from its computed stats, worded as in validate.py"""
+    validation_type = validation.get("type")
+    count = stats.get(key)
+    
+    if validation_type == ValidationType.REQUIRED:
+        return [f"Column '{column}' has {count} missing values"] if count else []
+    
+    elif validation_type == ValidationType.UNIQUE:
+        return [f"Column '{column}' has {count} duplicate values"] if count else []
+    
+    elif validation_type in (ValidationType.MIN, ValidationType.MAX):
+        if not dtype.is_numeric():
+            return [f"Column '{column}' is not numeric, min/max validation skipped"]
+        if not count:
+            return []
+        value = validation.get("value")
+        if validation_type == ValidationType.MIN:
+            return [f"Column '{column}' has {count} values below minimum {value}"]
+        return [f"Column '{column}' has {count} values above maximum {value}"]
+    
+    elif validation_type == ValidationType.REGEX:
+        if not count:
+            return []
+        return [f"Column '{column}' has {count} values that don't match pattern '{validation.get('pattern') or ''}'"]
+    
+    elif validation_type == ValidationType.ALLOWED_SET:
+        if not count:
+            return []
+        invalid_values = stats.get(f"{key}__values") or []
+        return [f"Column '{column}' has {count} values not in allowed set. Some invalid values: {', '.join(map(str, invalid_values))}"]
+    
+    elif validation_type == ValidationType.DATE_RANGE:
+        if dtype != pl.Datetime:
+            return [f"Column '{column}' is not a date/datetime, date range validation skipped"]
+        warnings = []
+        if stats.get(f"{key}__min"):
+            warnings.append(f"Column '{column}' has {stats[f'{key}__min']} dates before {validation.get('min')}")
+        if stats.get(f"{key}__max"):
+            warnings.append(f"Column '{column}' has {stats[f'{key}__max']} dates after {validation.get('max')}")
+        return warnings
+    
+    return []
+
+def scan_csv(file_path: str, delimiter: Optional[str] = None, n_rows: Optional[int] = None) -> pl.LazyFrame:
+    """Lazily scan a CSV with every column as strings and pandas' missing value markers"""
+    return pl.scan_csv(
+        file_path,
+        separator=delimiter or ",",
+        infer_schema_length=0,
+        null_values=NA_VALUES,
+        n_rows=n_rows,
+    )
+
+def column_rule_exprs(rules: RuleSet, columns: List[str], float_type: pl.DataType = pl.Float64) -> List[pl.Expr]:
+    """Build one expression chain per column: dtype, then imputation, then transforms"""
+    exprs = []
+    for column_rule in rules.columns:
+        column_name = column_rule.name
+        
+        if column_name not in columns:
+            continue
+        
+        expr = dtype_expr(pl.col(column_name), column_rule.dtype, float_type)
+        
+        if column_rule.impute:
+            expr = impute_expr(expr, column_rule)
+        
+        for transform in column_rule.transforms or []:
+            expr = transform_expr(expr, transform)
+        
+        exprs.append(expr.alias(column_name))
+    
+    return exprs
+
+def to_pandas_frame(df: pl.DataFrame) -> pd.DataFrame:
+    """Convert a result to pandas with the column types the pandas pipeline produces"""
+    pdf = df.to_pandas()
+    for column, dtype in df.schema.items():
+        if dtype == pl.Date:
+            # DATE columns hold datetime.date objects, as from .dt.date
+            pdf[column] = pdf[column].dt.date
+        elif dtype == pl.Datetime:
+            pdf[column] = pdf[column].dt.as_unit("ns")
+    return pdf
+
+def apply_row_rules(lf: pl.LazyFrame, rules: RuleSet) -> pl.LazyFrame:
+    """Add deduplication and outlier detection to a plan"""
+    schema = lf.collect_schema()
+    
+    # Apply deduplicate
+    if rules.deduplicate:
+        subset = [col for col in rules.deduplicate.get("subset", []) if col in schema]
+        if subset:
+            lf = lf.unique(subset=subset, keep="first", maintain_order=True)
+    
+    # Apply outlier detection
+    if rules.outliers:
+        outlier_exprs = [
+            outlier_expr(column, rules.outliers.method, rules.outliers.action, schema[column])
+            for column in rules.outliers.columns
+            if column in schema and schema[column].is_numeric()
+        ]
+        if outlier_exprs:
+            lf = lf.with_columns(outlier_exprs)
+    
+    return lf
+
+def apply_rules_polars(
+    file_path: str,
+    rules: RuleSet,
+    export_options: ExportOptions
+) -> pd.DataFrame:
+    """Apply rules to a CSV with a single Polars lazy query and return the result"""
+    lf = scan_csv(file_path, export_options.delimiter)
+    
+    exprs = column_rule_exprs(rules, lf.collect_schema().names(), polars_float_type(export_options))
+    if exprs:
+        lf = lf.with_columns(exprs)
+    
+    return to_pandas_frame(apply_row_rules(lf, rules).collect(engine="streaming"))
+
+def preview_rules_polars(file_path: str, rules: RuleSet, n_rows: int) -> Tuple[pd.DataFrame, List[str]]:
+    """Apply rules and validations to the first rows of a CSV and return the result and warnings
+    
+    Validation stats are computed from the transformed columns, and both
+    queries are collected together so they share the scan.
+    """
+    lf = scan_csv(file_path, n_rows=n_rows)
+    columns = lf.collect_schema().names()
+    
+    exprs = column_rule_exprs(rules, columns)
+    if exprs:
+        lf = lf.with_columns(exprs)
+    schema = lf.collect_schema()
+    
+    checks = []
+    stats_exprs = []
+    for column_rule in rules.columns:
+        column_name = column_rule.name
+        
+        if column_name not in columns:
+            checks.append((column_name, None, None))
+            continue
+        
+        for validation in column_rule.validations or []:
+            validation = validation.dict()
+            key = f"v{len(checks)}"
+            stats_exprs.extend(validation_exprs(column_name, validation, schema[column_name], key))
+            checks.append((column_name, validation, key))
+    
+    result_lf = apply_row_rules(lf, rules)
+    if stats_exprs:
+        df, stats_df = pl.collect_all([result_lf, lf.select(stats_exprs)])
+        stats = stats_df.row(0, named=True)
+    else:
+        df = result_lf.collect()
+        stats = {}
+    
+    warnings = []
+    for column_name, validation, key in checks:
+        if validation is None:
+            warnings.append(f"Column '{column_name}' not found")
+            continue
+        warnings.extend(validation_warnings(column_name, validation, schema[column_name], stats, key))
+    
+    return to_pandas_frame(df), warnings
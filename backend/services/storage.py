@@ -0,0 +1,78 @@
+# backend/app/services/storage.py
+import os
+import shutil
+import orjson
+import logging
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+TEMP_DIR = os.getenv("TEMP_DIR", "./tmp")
+META_FILE = ".meta"
+
+# Deleted uploads are renamed here, then removed in the background
+TRASH_DIR = os.path.join(TEMP_DIR, ".trash")
+
+# upload_id -> path of the uploaded file, filled in as uploads are created
+_UPLOAD_INDEX: Dict[str, str] = {}
+
+def register_upload(upload_id: str, file_path: str) -> None:
+    """Remember where an upload's file lives, in memory and next to the file"""
+    _UPLOAD_INDEX[upload_id] = file_path
+    
+    # Persist so other workers and restarts can resolve it without a scan
+    meta_path = os.path.join(TEMP_DIR, upload_id, META_FILE)
+    try:
+        with open(meta_path, "wb") as f:
+            f.write(orjson.dumps({"file_path": file_path}))
+    except OSError as e:
+        logger.warning(f"Error writing upload meta for {upload_id}: {e}")
+
+def resolve_upload(upload_id: str) -> Optional[str]:
+    """Return the uploaded file path for upload_id, or None if it doesn't exist"""
+    file_path = _UPLOAD_INDEX.get(upload_id)
+    if file_path:
+        # Another worker may have deleted the upload since it was cached
+        if os.path.exists(file_path):
+            return file_path
+        _UPLOAD_INDEX.pop(upload_id, None)
+    
+    upload_dir = os.path.join(TEMP_DIR, upload_id)
+    
+    # Fall back to the persisted meta, then to scanning the directory
+    try:
+        with open(os.path.join(upload_dir, META_FILE), "rb") as f:
+            file_path = orjson.loads(f.read()).get("file_path")
+    except (OSError, orjson.JSONDecodeError):
+        file_path = None
+    
+    if not file_path:
+        try:
+            with os.scandir(upload_dir) as entries:
+                file_path = next(
+                    (entry.path for entry in entries if entry.is_file() and entry.name != META_FILE),
+                    None
+                )
+        except OSError:
+            return None
+    
+    if file_path:
+        _UPLOAD_INDEX[upload_id] = file_path
+    return file_path
+
+def forget_upload(upload_id: str) -> None:
+    """Drop an upload from this process's index; other workers evict it on their next lookup"""
+    _UPLOAD_INDEX.pop(upload_id, None)
+
+def empty_trash() -> None:
+    """Delete upload directories left in the trash by interrupted background deletes"""
+    try:
+        with os.scandir(TRASH_DIR) as entries:
+            paths = [entry.path for entry in entries]
+    except OSError:
+        return
+    
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+    if paths:
+        logger.info(f"Removed {len(paths)} leftover upload directories from the trash")
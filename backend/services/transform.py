@@ -1,13 +1,17 @@
 import pandas as pd
-import numpy as np
+import pyarrow as pa
+import orjson
 import os
 from typing import Dict, Any, List, Optional
 import logging
 from app.models import RuleSet
+from app.services.parser import to_records
+from app.services.ingest import read_data
+from app.services.validate import dtype_kinds
+from app.services.processor_polars import file_supported_by_polars, rules_supported_by_polars, preview_rules_polars
 from app.services.processor import (
-    apply_dtype, 
-    apply_imputation, 
-    apply_transform,
+    apply_column_rule,
+    column_frame,
     apply_validation,
     apply_outlier_detection,
     apply_deduplication
@@ -15,65 +19,70 @@ from app.services.processor import (
 
 logger = logging.getLogger(__name__)
 
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
 def apply_rules_preview(
     file_path: str, 
-    rules: Optional[RuleSet] = None
+    rules: Optional[RuleSet] = None,
+    as_arrow: bool = False
 ) -> Dict[str, Any]:
-    """Apply rules to preview data (first 200 rows)"""
+    """Apply rules to preview data (first 200 rows)
+    
+    With as_arrow, the preview rows are returned as an Arrow table under
+    "table" instead of JSON rows under "rows", when Arrow can represent them.
+    """
     preview_rows = 200
     
     try:
-        # Read the file
-        file_ext = os.path.splitext(file_path)[1].lower()
-        
-        if file_ext in [".xls", ".xlsx"]:
-            df = pd.read_excel(file_path, dtype=str, nrows=preview_rows)
-        else:
-            df = pd.read_csv(
-                file_path,
-                dtype=str,
-                nrows=preview_rows,
-                on_bad_lines='skip',
-                low_memory=False
-            )
-        
+        df = None
         warnings = []
         
-        # Apply rules if provided
-        if rules and rules.columns:
-            # Apply data types and transforms
-            for column_rule in rules.columns:
-                column_name = column_rule.name
-                
-                if column_name not in df.columns:
-                    warnings.append(f"Column '{column_name}' not found")
-                    continue
-                
-                # Apply data type
-                df = apply_dtype(df, column_name, column_rule.dtype)
+        # Files the job would run through Polars are previewed with the same
+        # plan, so the preview shows what the job will export
+        if rules and rules.columns and file_supported_by_polars(file_path) and rules_supported_by_polars(rules):
+            try:
+                df, warnings = preview_rules_polars(file_path, rules, preview_rows)
+            except Exception as e:
+                logger.warning(f"Polars preview failed, falling back to pandas: {e}")
+                df, warnings = None, []
+        
+        if df is None:
+            # Read the file
+            df = read_data(file_path, nrows=preview_rows)
+            
+            # Apply rules if provided
+            if rules and rules.columns:
+                # Apply data types and transforms on per-column frames, then
+                # merge all results back with a single assign
+                updates = {}
+                for column_rule in rules.columns:
+                    column_name = column_rule.name
+                    
+                    # Columns created by an earlier rule (e.g. SPLIT) are pending updates
+                    if column_name not in df.columns and column_name not in updates:
+                        warnings.append(f"Column '{column_name}' not found")
+                        continue
+                    
+                    column_df = apply_column_rule(column_frame(df, column_name, updates), column_rule)
+                    updates.update(column_df.items())
+                    
+                    # Apply validations
+                    if column_rule.validations:
+                        kinds = dtype_kinds(column_df)
+                        for validation in column_rule.validations:
+                            column_warnings = apply_validation(column_df, column_name, validation.dict(), kinds)
+                            warnings.extend(column_warnings)
                 
-                # Apply imputation
-                if column_rule.impute:
-                    df = apply_imputation(df, column_name, column_rule.impute.dict())
+                if updates:
+                    df = df.assign(**updates)
                 
-                # Apply transformations
-                if column_rule.transforms:
-                    for transform in column_rule.transforms:
-                        df = apply_transform(df, column_name, transform.dict())
+                # Apply deduplicate
+                if rules.deduplicate:
+                    df = apply_deduplication(df, rules.deduplicate)
                 
-                # Apply validations
-                if column_rule.validations:
-                    for validation in column_rule.validations:
-                        column_warnings = apply_validation(df, column_name, validation.dict())
-                        warnings.extend(column_warnings)
-            
-            # Apply deduplicate
-            if rules.deduplicate:
-                df = apply_deduplication(df, rules.deduplicate)
-            
-            # Apply outlier detection
-            if rules.outliers:
-                df = apply_outlier_detection(df, rules.outliers.dict())
+                # Apply outlier detection
+                if rules.outliers:
+                    df = apply_outlier_detection(df, rules.outliers.dict())
         
         # Infer column types for response
         columns = []
@@ -86,11 +95,9 @@ def apply_rules_preview(
             elif pd.api.types.is_bool_dtype(df[column]):
                 inferred_type = "Boolean"
             elif pd.api.types.is_datetime64_dtype(df[column]):
-                has_time = False
-                for val in df[column].dropna():
-                    if hasattr(val, "time") and val.time() != pd.Timestamp("00:00:00").time():
-                        has_time = True
-                        break
+                # Any value off midnight means the column carries times (NaT never equals itself)
+                values = df[column]
+                has_time = bool((values.notna() & (values != values.dt.normalize())).any())
                 inferred_type = "Datetime" if has_time else "Date"
             
             columns.append({
@@ -98,15 +105,40 @@ def apply_rules_preview(
                 "inferredType": inferred_type
             })
         
-        # Convert DataFrame to list of dictionaries for JSON response
-        rows = df.replace({np.nan: None}).head(20).to_dict('records')
-        
-        return {
+        result = {
             "columns": columns,
-            "rows": rows,
             "warnings": warnings
         }
+        
+        preview_df = df.head(20)
+        if as_arrow:
+            try:
+                result["table"] = pa.Table.from_pandas(preview_df, preserve_index=False)
+                return result
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+                logger.warning(f"Arrow preview conversion failed, falling back to JSON: {e}")
+        
+        # Convert DataFrame to list of dictionaries for JSON response
+        result["rows"] = to_records(preview_df)
+        
+        return result
     
     except Exception as e:
         logger.error(f"Error applying rules preview: {e}")
-        raise
\ No newline at end of file
+        raise
+
+def preview_to_arrow_stream(preview_result: Dict[str, Any]) -> bytes:
+    """Serialize an Arrow preview as an IPC stream
+    
+    Column types and warnings travel in the schema metadata.
+    """
+    table = preview_result["table"]
+    metadata = dict(table.schema.metadata or {})
+    metadata[b"columns"] = orjson.dumps(preview_result["columns"])
+    metadata[b"warnings"] = orjson.dumps(preview_result.get("warnings", []))
+    table = table.replace_schema_metadata(metadata)
+    
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
@@ -1,35 +1,55 @@
 # backend/app/services/validate.py
 import pandas as pd
 import numpy as np
+import re
+import pyarrow as pa
+import pyarrow.compute as pc
 from typing import List, Dict, Any, Optional
 import logging
 from app.models import ValidationType
 
 logger = logging.getLogger(__name__)
 
+# dtype kinds pandas' is_numeric_dtype accepts: bool, int, uint, float, complex
+NUMERIC_KINDS = frozenset("biufc")
+
+def dtype_kinds(df: pd.DataFrame) -> Dict[str, str]:
+    """Map each column to its dtype kind ('i', 'f', 'M', 'O', ...) in one pass over df.dtypes"""
+    return {column: dtype.kind for column, dtype in df.dtypes.items()}
+
 def validate_required(df: pd.DataFrame, column: str) -> List[str]:
     """Validate that column has no missing values"""
     warnings = []
-    mask = df[column].isna()
-    if mask.any():
-        count = mask.sum()
+    values = df[column]
+    if values.dtype.kind == "f":
+        # Plain float columns mark missing values as NaN in the buffer itself
+        count = int(np.count_nonzero(np.isnan(values.to_numpy())))
+    else:
+        count = int(values.isna().sum())
+    if count:
         warnings.append(f"Column '{column}' has {count} missing values")
     return warnings
 
 def validate_unique(df: pd.DataFrame, column: str) -> List[str]:
     """Validate that column has no duplicate values"""
     warnings = []
-    mask = df[column].duplicated()
-    if mask.any():
-        count = mask.sum()
+    # Every value beyond the first of its kind is a duplicate; missing values count as one kind
+    count = len(df) - df[column].nunique(dropna=False)
+    if count:
         warnings.append(f"Column '{column}' has {count} duplicate values")
     return warnings
 
-def validate_min_max(df: pd.DataFrame, column: str, min_value: Optional[Any] = None, max_value: Optional[Any] = None) -> List[str]:
+def validate_min_max(
+    df: pd.DataFrame,
+    column: str,
+    min_value: Optional[Any] = None,
+    max_value: Optional[Any] = None,
+    kind: Optional[str] = None
+) -> List[str]:
     """Validate that column values are within min and max range"""
     warnings = []
     
-    if not pd.api.types.is_numeric_dtype(df[column]):
+    if (kind or df[column].dtype.kind) not in NUMERIC_KINDS:
         warnings.append(f"Column '{column}' is not numeric, min/max validation skipped")
         return warnings
     
@@ -47,14 +67,48 @@ def validate_min_max(df: pd.DataFrame, column: str, min_value: Optional[Any] = N
     
     return warnings
 
+# Syntax RE2 reads differently from Python's re: ASCII-only \w \d \b \s,
+# RE2-only escapes (\p{..}, \Q..\E, \C, \z), POSIX classes like [[:alpha:]],
+# which re reads as a plain bracket set, and the ungreedy (?U) flag
+RE2_SPECIFIC_SYNTAX = re.compile(r"\\[wWdDbBsSpPQECz]|\[:|\(\?[a-zA-Z]*U")
+
+def re2_matches_like_re(pattern: str) -> bool:
+    """Check whether RE2 gives the same matches as Python's re for a pattern
+    
+    Patterns using syntax RE2 reads differently, and non-ASCII patterns, are
+    left to Python's re.
+    """
+    return pattern.isascii() and not RE2_SPECIFIC_SYNTAX.search(pattern)
+
+def count_regex_mismatches(series: pd.Series, pattern: str) -> int:
+    """Count values that don't match a pattern at their start, like str.match
+    
+    Missing values count as mismatches. Uses Arrow's RE2 kernel, which runs
+    in linear time, when it matches the same values as Python's re; other
+    patterns use Python's re.
+    """
+    missing = series.isna()
+    count = int(missing.sum())
+    values = series[~missing] if count else series
+    if not pd.api.types.is_string_dtype(values):
+        values = values.astype(str)
+    
+    if re2_matches_like_re(pattern):
+        try:
+            matched = pc.match_substring_regex(pa.array(values), f"^(?:{pattern})")
+            return count + (pc.sum(pc.invert(matched)).as_py() or 0)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass  # Syntax RE2 doesn't support, e.g. lookarounds
+    # Object strings so pandas runs Python's re rather than Arrow's RE2 kernel
+    return count + int((~values.astype(object).str.match(pattern)).sum())
+
 def validate_regex(df: pd.DataFrame, column: str, pattern: str) -> List[str]:
     """Validate that column values match regex pattern"""
     warnings = []
     
     try:
-        mask = ~df[column].astype(str).str.match(pattern)
-        if mask.any():
-            count = mask.sum()
+        count = count_regex_mismatches(df[column], pattern)
+        if count:
             warnings.append(f"Column '{column}' has {count} values that don't match pattern '{pattern}'")
     except Exception as e:
         warnings.append(f"Error validating regex pattern for '{column}': {str(e)}")
@@ -76,17 +130,29 @@ def validate_allowed_set(df: pd.DataFrame, column: str, allowed: List[Any]) -> L
     
     return warnings
 
-def validate_date_range(df: pd.DataFrame, column: str, min_date: Optional[str] = None, max_date: Optional[str] = None) -> List[str]:
+def localize_bound(bound: pd.Timestamp, values: pd.Series) -> pd.Timestamp:
+    """Give a naive date bound the time zone of a tz-aware column so they compare"""
+    if values.dt.tz is not None and bound.tz is None:
+        return bound.tz_localize(values.dt.tz)
+    return bound
+
+def validate_date_range(
+    df: pd.DataFrame,
+    column: str,
+    min_date: Optional[str] = None,
+    max_date: Optional[str] = None,
+    kind: Optional[str] = None
+) -> List[str]:
     """Validate that dates are within range"""
     warnings = []
     
-    if not pd.api.types.is_datetime64_dtype(df[column]):
+    if (kind or df[column].dtype.kind) != "M":
         warnings.append(f"Column '{column}' is not a date/datetime, date range validation skipped")
         return warnings
     
     if min_date:
         try:
-            min_date_dt = pd.to_datetime(min_date)
+            min_date_dt = localize_bound(pd.to_datetime(min_date), df[column])
             mask = df[column] < min_date_dt
             if mask.any():
                 count = mask.sum()
@@ -96,7 +162,7 @@ def validate_date_range(df: pd.DataFrame, column: str, min_date: Optional[str] =
     
     if max_date:
         try:
-            max_date_dt = pd.to_datetime(max_date)
+            max_date_dt = localize_bound(pd.to_datetime(max_date), df[column])
             mask = df[column] > max_date_dt
             if mask.any():
                 count = mask.sum()
@@ -106,10 +172,20 @@ def validate_date_range(df: pd.DataFrame, column: str, min_date: Optional[str] =
     
     return warnings
 
-def validate_column(df: pd.DataFrame, column: str, validation: Dict[str, Any]) -> List[str]:
-    """Apply validation to column and return warnings"""
+def validate_column(
+    df: pd.DataFrame,
+    column: str,
+    validation: Dict[str, Any],
+    kinds: Optional[Dict[str, str]] = None
+) -> List[str]:
+    """Apply validation to column and return warnings
+    
+    kinds maps columns to dtype kinds, so callers running many validations
+    on one frame can compute it once with dtype_kinds.
+    """
     validation_type = validation.get("type")
     warnings = []
+    kind = kinds.get(column) if kinds else None
     
     try:
         if validation_type == ValidationType.REQUIRED:
@@ -120,11 +196,11 @@ def validate_column(df: pd.DataFrame, column: str, validation: Dict[str, Any]) -
         
         elif validation_type == ValidationType.MIN:
             min_value = validation.get("value")
-            warnings.extend(validate_min_max(df, column, min_value=min_value))
+            warnings.extend(validate_min_max(df, column, min_value=min_value, kind=kind))
         
         elif validation_type == ValidationType.MAX:
             max_value = validation.get("value")
-            warnings.extend(validate_min_max(df, column, max_value=max_value))
+            warnings.extend(validate_min_max(df, column, max_value=max_value, kind=kind))
         
         elif validation_type == ValidationType.REGEX:
             pattern = validation.get("pattern", "")
@@ -137,7 +213,7 @@ def validate_column(df: pd.DataFrame, column: str, validation: Dict[str, Any]) -
         elif validation_type == ValidationType.DATE_RANGE:
             min_date = validation.get("min")
             max_date = validation.get("max")
-            warnings.extend(validate_date_range(df, column, min_date, max_date))
+            warnings.extend(validate_date_range(df, column, min_date, max_date, kind=kind))
     
     except Exception as e:
         logger.warning(f"Error applying validation {validation_type} to column {column}: {e}")
@@ -0,0 +1,67 @@
+import pytest
+import pandas as pd
+import numpy as np
+import os
+from pydantic import ValidationError
+import sys
+from pathlib import Path
+
+# Add the app directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.export import export_data, export_chunks
+from app.services.constants import float_dtype_for
+from app.models import ExportOptions
+
+@pytest.fixture
+def export_df():
+    return pd.DataFrame({
+        'id': [1, 2],
+        'name': ['AL', 'B, "quoted"'],
+        'amt': [1000.0, np.nan],
+        'active': [True, False],
+        'when': pd.to_datetime(['2021-01-05 10:30:00', '2021-01-06 00:00:00'])
+    })
+
+GOLDEN_CSV = (
+    'id,name,amt,active,when\n'
+    '1,AL,1000.0,True,2021-01-05 10:30:00\n'
+    '2,"B, ""quoted""",,False,2021-01-06 00:00:00\n'
+)
+
+def read_export(output_dir, download_path):
+    with open(os.path.join(output_dir, os.path.basename(download_path)), 'rb') as f:
+        return f.read().decode('utf-8')
+
+# Test CSV export output byte for byte
+def test_export_csv_golden_output(export_df, tmp_path):
+    download_path = export_data(export_df, ExportOptions(format='csv'), str(tmp_path))
+    assert read_export(tmp_path, download_path) == GOLDEN_CSV
+
+def test_export_csv_string_columns_are_not_quoted(tmp_path):
+    df = pd.DataFrame({'id': ['1'], 'name': ['AL']}).astype('string[pyarrow]')
+    download_path = export_data(df, ExportOptions(format='csv'), str(tmp_path))
+    assert read_export(tmp_path, download_path) == 'id,name\n1,AL\n'
+
+def test_export_chunks_matches_single_export(export_df, tmp_path):
+    single_dir = tmp_path / 'single'
+    chunked_dir = tmp_path / 'chunked'
+    single_dir.mkdir()
+    chunked_dir.mkdir()
+    
+    # Datetime rendering depends on the whole column, so those rules aren't chunked
+    df = export_df.drop(columns=['when'])
+    options = ExportOptions(format='csv')
+    single = export_data(df, options, str(single_dir))
+    chunked = export_chunks([df.iloc[:1], df.iloc[1:]], options, str(chunked_dir))
+    
+    assert read_export(chunked_dir, chunked) == read_export(single_dir, single)
+    assert read_export(chunked_dir, chunked).startswith('id,name,amt,active\n1,AL,1000.0,True\n')
+
+# Test numeric precision only accepts the float dtypes FLOAT columns can be cast to
+def test_export_options_numeric_precision():
+    assert float_dtype_for(ExportOptions(format='csv')) is np.float64
+    assert float_dtype_for(ExportOptions(format='csv', numeric_precision='float32')) is np.float32
+    assert float_dtype_for(ExportOptions(format='csv', numeric_precision=None)) is np.float64
+    with pytest.raises(ValidationError):
+        ExportOptions(format='csv', numeric_precision='float16')
@@ -0,0 +1,55 @@
+import pytest
+import pandas as pd
+import numpy as np
+import os
+import sys
+from pathlib import Path
+
+# Add the app directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.parser import infer_column_type, parse_sample
+from app.models import ColumnDType, FileType
+
+def write_csv(tmp_path, text):
+    file_path = tmp_path / "data.csv"
+    file_path.write_text(text, encoding="utf-8")
+    return str(file_path)
+
+def column_types(sample):
+    return {column["name"]: column["inferredType"] for column in sample["columns"]}
+
+# Test infer_column_type
+def test_infer_column_type_date():
+    assert infer_column_type(pd.Series(['2021-01-01', '2021-02-01'])) == ColumnDType.DATE
+
+def test_infer_column_type_datetime():
+    assert infer_column_type(pd.Series(['2021-01-01 10:00:00', '2021-02-01 00:00:00'])) == ColumnDType.DATETIME
+
+def test_infer_column_type_mixed_utc_offsets():
+    series = pd.Series(['2021-01-01T10:00:00+01:00', '2021-01-02T11:00:00+02:00'])
+    assert infer_column_type(series) == ColumnDType.DATETIME
+
+def test_infer_column_type_mixed_utc_offsets_at_midnight():
+    series = pd.Series(['2021-01-01T00:00:00+01:00', '2021-01-02T00:00:00+07:00'])
+    assert infer_column_type(series) == ColumnDType.DATE
+
+# Test parse_sample
+def test_parse_sample_mixed_utc_offsets(tmp_path):
+    file_path = write_csv(tmp_path, "id,ts\n1,2021-01-01 10:00:00 +01:00\n2,2021-01-02 11:00:00 +02:00\n")
+    sample = parse_sample(file_path, FileType.CSV)
+    assert column_types(sample)["ts"] == ColumnDType.DATETIME
+    assert len(sample["rows"]) == 2
+
+def test_parse_sample_missing_value_markers(tmp_path):
+    file_path = write_csv(tmp_path, "id,score\n1,1.5\n2,NA\n3,null\n4,\n5,2\n")
+    sample = parse_sample(file_path, FileType.CSV)
+    assert column_types(sample)["score"] == ColumnDType.FLOAT
+    assert [row["score"] for row in sample["rows"]] == [1.5, None, None, None, 2.0]
+
+def test_parse_sample_keeps_short_rows(tmp_path):
+    file_path = write_csv(tmp_path, "id,name,amt\n1,a,5\n2,b\n3,c,7,extra\n4,d,9.5\n")
+    sample = parse_sample(file_path, FileType.CSV)
+    assert [row["id"] for row in sample["rows"]] == [1, 2, 4]
+    assert sample["rows"][1]["amt"] is None
+    assert column_types(sample)["amt"] == ColumnDType.FLOAT
@@ -0,0 +1,274 @@
+import pytest
+import pandas as pd
+import numpy as np
+import os
+import sys
+import json
+from pathlib import Path
+
+# Add the app directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services import processor, processor_polars, transform
+from app.services.processor import process_file, can_process_in_chunks, apply_column_rules
+from app.services.processor_polars import apply_rules_polars, rules_supported_by_polars, preview_rules_polars
+from app.services.transform import apply_rules_preview
+from app.services.ingest import read_data
+from app.models import (
+    RuleSet, ExportOptions, ColumnRule, Transform, Impute, Outliers,
+    ColumnDType, TransformType, ImputeStrategy, OutlierMethod, OutlierAction,
+)
+
+SAMPLE_CSV = (
+    "id,name,amt,joined\n"
+    "1,  Al  ,1000,2021-01-05\n"
+    "2,Bo,,2021-01-06\n"
+    "3,Cy,2.5,2021-01-07 10:30:00\n"
+    "4,Di,7,\n"
+)
+
+def write_upload(tmp_path, name, text):
+    upload_dir = tmp_path / name
+    upload_dir.mkdir()
+    file_path = upload_dir / "data.csv"
+    file_path.write_text(text, encoding="utf-8")
+    return str(file_path)
+
+def run_job(file_path, rules, export_options):
+    """Run process_file and return the exported file's text"""
+    process_file(file_path, rules, export_options, "job", "upload")
+    output_path = os.path.join(os.path.dirname(file_path), "output", f"cleaned_data.{export_options.format}")
+    with open(output_path, encoding="utf-8") as f:
+        return f.read()
+
+def run_both_ways(tmp_path, monkeypatch, text, rules, export_options):
+    """Run a job in one frame and in 2-row chunks and return both outputs"""
+    monkeypatch.setattr(processor, "can_process_in_chunks", lambda *args: False)
+    whole = run_job(write_upload(tmp_path, "whole", text), rules, export_options)
+    
+    monkeypatch.setattr(processor, "can_process_in_chunks", can_process_in_chunks)
+    monkeypatch.setattr(processor, "CHUNK_ROWS", 2)
+    chunked = run_job(write_upload(tmp_path, "chunked", text), rules, export_options)
+    return whole, chunked
+
+def run_with_pandas_and_polars(tmp_path, monkeypatch, text, rules, export_options):
+    """Run a job through the pandas and the Polars pipelines and return both outputs"""
+    pandas_output = run_job(write_upload(tmp_path, "pandas", text), rules, export_options)
+    
+    # Fail the test instead of falling back to pandas when the Polars query errors
+    polars_results = []
+    def checked_apply_rules_polars(*args):
+        polars_results.append(apply_rules_polars(*args))
+        return polars_results[-1]
+    
+    monkeypatch.setattr(processor_polars, "POLARS_MIN_FILE_SIZE", 0)
+    monkeypatch.setattr(processor, "apply_rules_polars", checked_apply_rules_polars)
+    polars_output = run_job(write_upload(tmp_path, "polars", text), rules, export_options)
+    assert len(polars_results) == 1
+    return pandas_output, polars_output
+
+def test_chunked_job_matches_whole_frame_job(tmp_path, monkeypatch):
+    rules = RuleSet(columns=[
+        ColumnRule(name="id", dtype=ColumnDType.INTEGER),
+        ColumnRule(name="name", dtype=ColumnDType.STRING, transforms=[
+            Transform(type=TransformType.TRIM),
+            Transform(type=TransformType.UPPER),
+        ]),
+        ColumnRule(name="amt", dtype=ColumnDType.FLOAT),
+    ])
+    export_options = ExportOptions(format="csv")
+    assert can_process_in_chunks(write_upload(tmp_path, "check", SAMPLE_CSV), rules, export_options)
+    
+    whole, chunked = run_both_ways(tmp_path, monkeypatch, SAMPLE_CSV, rules, export_options)
+    assert chunked == whole
+    assert whole.splitlines()[1] == "1,AL,1000.0,2021-01-05"
+
+@pytest.mark.parametrize("column_rule", [
+    ColumnRule(name="joined", dtype=ColumnDType.DATE),
+    ColumnRule(name="joined", dtype=ColumnDType.DATETIME),
+    ColumnRule(name="joined", dtype=ColumnDType.STRING, transforms=[Transform(type=TransformType.PARSE_DATE)]),
+])
+def test_column_wide_rendering_is_not_chunked(tmp_path, column_rule):
+    file_path = write_upload(tmp_path, "upload", SAMPLE_CSV)
+    assert not can_process_in_chunks(file_path, RuleSet(columns=[column_rule]), ExportOptions(format="csv"))
+
+def test_parse_date_with_formats_is_chunked(tmp_path, monkeypatch):
+    rules = RuleSet(columns=[ColumnRule(name="joined", dtype=ColumnDType.STRING, transforms=[
+        Transform(type=TransformType.PARSE_DATE, format="%Y-%m-%d"),
+    ])])
+    export_options = ExportOptions(format="csv", date_format="%Y-%m-%d %H:%M")
+    assert can_process_in_chunks(write_upload(tmp_path, "check", SAMPLE_CSV), rules, export_options)
+    
+    whole, chunked = run_both_ways(tmp_path, monkeypatch, SAMPLE_CSV, rules, export_options)
+    assert chunked == whole
+
+PARITY_CSV = (
+    "id,name,amt,joined,price\n"
+    " 1 ,  Al  ,1000,2021-01-05,5\n"
+    "2,Bo,,2021-01-06,7\n"
+    "3,Cy,2.5,2021-01-07,\n"
+    "4,Di,7,,9\n"
+)
+
+PARITY_RULES = RuleSet(columns=[
+    ColumnRule(name="id", dtype=ColumnDType.INTEGER),
+    ColumnRule(name="name", dtype=ColumnDType.STRING, transforms=[
+        Transform(type=TransformType.TRIM),
+        Transform(type=TransformType.UPPER),
+    ]),
+    ColumnRule(name="amt", dtype=ColumnDType.FLOAT),
+    ColumnRule(name="joined", dtype=ColumnDType.STRING, transforms=[
+        Transform(type=TransformType.PARSE_DATE, format="%Y-%m-%d"),
+    ]),
+    ColumnRule(name="price", dtype=ColumnDType.STRING, transforms=[
+        Transform(type=TransformType.REPLACE, pattern=r"(\d)", replacement="$1 or \\1"),
+    ]),
+])
+
+@pytest.mark.parametrize("export_options", [
+    ExportOptions(format="csv"),
+    ExportOptions(format="csv", numeric_precision="float32"),
+    ExportOptions(format="csv", numeric_precision="float32", date_format="%d.%m.%Y"),
+    ExportOptions(format="json", numeric_precision="float32"),
+])
+def test_polars_job_matches_pandas_job(tmp_path, monkeypatch, export_options):
+    pandas_output, polars_output = run_with_pandas_and_polars(
+        tmp_path, monkeypatch, PARITY_CSV, PARITY_RULES, export_options
+    )
+    assert polars_output == pandas_output
+    if export_options.format == "csv" and not export_options.date_format:
+        assert pandas_output.splitlines()[1] == "1,AL,1000.0,2021-01-05,$1 or 5"
+
+def test_polars_parse_date_with_timezone_matches_pandas(tmp_path, monkeypatch):
+    text = "joined\n2021-01-05 00:00:00\n2021-01-06 10:30:00\n"
+    rules = RuleSet(columns=[ColumnRule(name="joined", dtype=ColumnDType.STRING, transforms=[
+        Transform(type=TransformType.PARSE_DATE, format="%Y-%m-%d %H:%M:%S", timezone="Asia/Bangkok"),
+    ])])
+    pandas_output, polars_output = run_with_pandas_and_polars(
+        tmp_path, monkeypatch, text, rules, ExportOptions(format="json")
+    )
+    assert polars_output == pandas_output
+
+@pytest.mark.parametrize("column_rule", [
+    ColumnRule(name="joined", dtype=ColumnDType.DATE),
+    ColumnRule(name="joined", dtype=ColumnDType.DATETIME),
+    ColumnRule(name="joined", dtype=ColumnDType.STRING, transforms=[Transform(type=TransformType.PARSE_DATE)]),
+])
+def test_column_wide_rules_stay_on_pandas(column_rule):
+    assert not rules_supported_by_polars(RuleSet(columns=[column_rule]))
+
+@pytest.mark.parametrize("polars_min_file_size", [0, 10**12])
+def test_preview_matches_job_output(tmp_path, monkeypatch, polars_min_file_size):
+    monkeypatch.setattr(processor_polars, "POLARS_MIN_FILE_SIZE", polars_min_file_size)
+    polars_previews = []
+    def recorded_preview_rules_polars(*args):
+        polars_previews.append(args)
+        return preview_rules_polars(*args)
+    monkeypatch.setattr(transform, "preview_rules_polars", recorded_preview_rules_polars)
+    
+    rules = RuleSet(columns=[
+        ColumnRule(name="id", dtype=ColumnDType.INTEGER),
+        ColumnRule(name="name", dtype=ColumnDType.STRING, transforms=[
+            Transform(type=TransformType.TRIM),
+            Transform(type=TransformType.UPPER),
+        ]),
+        ColumnRule(name="price", dtype=ColumnDType.STRING, transforms=[
+            Transform(type=TransformType.REPLACE, pattern=r"(\d)", replacement="$1 or \\1"),
+        ]),
+    ])
+    file_path = write_upload(tmp_path, "upload", PARITY_CSV)
+    preview = apply_rules_preview(file_path, rules)
+    job_output = run_job(file_path, rules, ExportOptions(format="json"))
+    
+    # The preview only takes the Polars path when the job does
+    assert len(polars_previews) == (1 if polars_min_file_size == 0 else 0)
+    assert preview["rows"] == [json.loads(line) for line in job_output.splitlines()]
+
+SPLIT_RULES = RuleSet(columns=[
+    ColumnRule(name="name", dtype=ColumnDType.STRING, transforms=[
+        Transform(type=TransformType.SPLIT, delimiter=" "),
+    ]),
+    ColumnRule(name="name_split", dtype=ColumnDType.JSON, transforms=[
+        Transform(type=TransformType.JOIN, delimiter="-"),
+    ]),
+    ColumnRule(name="id", dtype=ColumnDType.INTEGER),
+])
+
+def test_rules_on_columns_created_by_split():
+    df = pd.DataFrame({"id": ["1", "2"], "name": ["Al Bo", "Cy"]}, dtype="string[pyarrow]")
+    df = apply_column_rules(df, SPLIT_RULES)
+    assert list(df["name_split"]) == ["Al-Bo", "Cy"]
+    assert list(df["id"]) == [1, 2]
+
+def test_preview_rules_on_columns_created_by_split(tmp_path):
+    file_path = write_upload(tmp_path, "upload", "id,name\n1,Al Bo\n2,Cy\n")
+    preview = apply_rules_preview(file_path, SPLIT_RULES)
+    assert preview["warnings"] == []
+    assert [row["name_split"] for row in preview["rows"]] == ["Al-Bo", "Cy"]
+
+def test_whole_number_float_column_with_mean_imputation(tmp_path, monkeypatch):
+    text = "id,amt\n1,500\n2,\n3,507\n4,NA\n"
+    rules = RuleSet(columns=[ColumnRule(
+        name="amt",
+        dtype=ColumnDType.FLOAT,
+        impute=Impute(strategy=ImputeStrategy.MEAN),
+    )])
+    export_options = ExportOptions(format="csv")
+    pandas_output, polars_output = run_with_pandas_and_polars(tmp_path, monkeypatch, text, rules, export_options)
+    assert pandas_output == "id,amt\n1,500.0\n2,503.5\n3,507.0\n4,503.5\n"
+    assert polars_output == pandas_output
+    
+    preview = apply_rules_preview(write_upload(tmp_path, "preview", text), rules)
+    assert [row["amt"] for row in preview["rows"]] == [500.0, 503.5, 507.0, 503.5]
+
+RAGGED_CSV = "id,name,amt\n1,a,5\n2,b\n3,c,7,extra\n4,d,9\n"
+
+def test_read_data_pads_short_rows_and_skips_long_rows(tmp_path):
+    df = read_data(write_upload(tmp_path, "upload", RAGGED_CSV))
+    assert list(df["id"]) == ["1", "2", "4"]
+    assert pd.isna(df["amt"].iloc[1])
+
+def test_chunked_job_keeps_short_rows(tmp_path, monkeypatch):
+    rules = RuleSet(columns=[ColumnRule(name="name", dtype=ColumnDType.STRING, transforms=[
+        Transform(type=TransformType.UPPER),
+    ])])
+    text = "id,name,amt\n1,a,5\n2,b\n3,c,7\n"
+    whole, chunked = run_both_ways(tmp_path, monkeypatch, text, rules, ExportOptions(format="csv"))
+    assert whole == "id,name,amt\n1,A,5\n2,B,\n3,C,7\n"
+    assert chunked == whole
+
+@pytest.mark.parametrize("column_rule", [
+    ColumnRule(name="grade", dtype=ColumnDType.STRING, transforms=[
+        Transform(type=TransformType.MAP_VALUES, mapping={"a": "A", "b": None}),
+    ]),
+    ColumnRule(name="score", dtype=ColumnDType.INTEGER, impute=Impute(strategy=ImputeStrategy.MEAN)),
+    ColumnRule(name="score", dtype=ColumnDType.INTEGER, impute=Impute(strategy=ImputeStrategy.MEDIAN)),
+    ColumnRule(name="amt", dtype=ColumnDType.FLOAT, impute=Impute(strategy=ImputeStrategy.MEDIAN)),
+])
+@pytest.mark.parametrize("export_format", ["csv", "json"])
+def test_polars_mapping_and_imputation_match_pandas(tmp_path, monkeypatch, column_rule, export_format):
+    text = "grade,score,amt\na,1,2.5\nb,,\nc,3,4\n"
+    rules = RuleSet(columns=[column_rule])
+    export_options = ExportOptions(format=export_format)
+    pandas_output, polars_output = run_with_pandas_and_polars(tmp_path, monkeypatch, text, rules, export_options)
+    assert polars_output == pandas_output
+
+def test_map_values_to_non_strings_stays_on_pandas():
+    rules = RuleSet(columns=[ColumnRule(name="grade", dtype=ColumnDType.STRING, transforms=[
+        Transform(type=TransformType.MAP_VALUES, mapping={"a": 1, "b": "B"}),
+    ])])
+    assert not rules_supported_by_polars(rules)
+
+@pytest.mark.parametrize("method", [OutlierMethod.IQR, OutlierMethod.ZSCORE])
+def test_polars_outlier_cap_matches_pandas(tmp_path, monkeypatch, method):
+    scores = [10, 11, 12, 11, 10, 12, 11, 10, 12, 11, 10, 12, 11, 10, 12, 11, 10, 12, 11, 90]
+    text = "score\n" + "".join(f"{score}\n" for score in scores)
+    rules = RuleSet(
+        columns=[ColumnRule(name="score", dtype=ColumnDType.INTEGER)],
+        outliers=Outliers(method=method, columns=["score"], action=OutlierAction.CAP),
+    )
+    pandas_output, polars_output = run_with_pandas_and_polars(
+        tmp_path, monkeypatch, text, rules, ExportOptions(format="csv")
+    )
+    assert polars_output == pandas_output
+    assert ".0" not in pandas_output
@@ -0,0 +1,35 @@
+import pytest
+import asyncio
+import sys
+from pathlib import Path
+
+# Add the app directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import queue
+from app.queue import EnqueueBatcher
+
+class RecordingQueue:
+    def __init__(self):
+        self.jobs = []
+    
+    def enqueue(self, func, *args, **kwargs):
+        self.jobs.append((func, args, kwargs))
+        return kwargs.get("job_id")
+
+def test_enqueue_batcher_starts_on_first_use(monkeypatch):
+    monkeypatch.setattr(queue, "USING_REDIS", False)
+    recording_queue = RecordingQueue()
+    batcher = EnqueueBatcher(recording_queue)
+    
+    async def enqueue_without_start():
+        try:
+            return await asyncio.gather(
+                batcher.enqueue(print, "a", job_id="job-a"),
+                batcher.enqueue(print, "b", job_id="job-b"),
+            )
+        finally:
+            await batcher.stop()
+    
+    assert asyncio.run(enqueue_without_start()) == ["job-a", "job-b"]
+    assert len(recording_queue.jobs) == 2
@@ -0,0 +1,39 @@
+import pytest
+import shutil
+import sys
+from pathlib import Path
+
+# Add the app directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services import storage
+from app.services.storage import register_upload, resolve_upload, empty_trash
+
+def test_resolve_upload_evicts_uploads_deleted_by_another_worker(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "TEMP_DIR", str(tmp_path))
+    upload_dir = tmp_path / "upload"
+    upload_dir.mkdir()
+    file_path = upload_dir / "data.csv"
+    file_path.write_text("id\n1\n", encoding="utf-8")
+    
+    register_upload("upload", str(file_path))
+    assert resolve_upload("upload") == str(file_path)
+    
+    # Deleted elsewhere: this process's cache still holds the path
+    shutil.rmtree(upload_dir)
+    assert resolve_upload("upload") is None
+    assert "upload" not in storage._UPLOAD_INDEX
+
+def test_empty_trash_removes_leftover_uploads(tmp_path, monkeypatch):
+    trash_dir = tmp_path / ".trash"
+    (trash_dir / "upload" / "output").mkdir(parents=True)
+    (trash_dir / "upload" / "data.csv").write_text("id\n1\n", encoding="utf-8")
+    monkeypatch.setattr(storage, "TRASH_DIR", str(trash_dir))
+    
+    empty_trash()
+    assert trash_dir.exists()
+    assert list(trash_dir.iterdir()) == []
+
+def test_empty_trash_without_trash_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "TRASH_DIR", str(tmp_path / ".trash"))
+    empty_trash()
@@ -101,6 +101,32 @@ def test_apply_transform_parse_date(sample_df):
     assert df['date'].iloc[0].strftime('%Y-%m-%d') == '2021-01-01'
     assert pd.isna(df['date'].iloc[2])  # Invalid date should be NaN
 
+def test_apply_transform_parse_date_exact_format():
+    df = pd.DataFrame({'date': ['2021-01-01', '2021-01-01T10:00']})
+    df = apply_transform(df, 'date', {'type': TransformType.PARSE_DATE, 'format': '%Y-%m-%d'})
+    assert df['date'].iloc[0] == pd.Timestamp('2021-01-01')
+    assert pd.isna(df['date'].iloc[1])  # Exact format: extra time component doesn't match
+
+def test_apply_transform_parse_date_default_format():
+    df = pd.DataFrame({'date': ['2021-03-04', '04/03/2021']})
+    df = apply_transform(df, 'date', {'type': TransformType.PARSE_DATE})
+    assert df['date'].iloc[0] == pd.Timestamp('2021-03-04')
+    assert pd.isna(df['date'].iloc[1])
+
+def test_apply_transform_parse_date_inferred_format():
+    df = pd.DataFrame({'date': ['01/02/2021', '03/04/2021']})
+    df = apply_transform(df, 'date', {'type': TransformType.PARSE_DATE, 'format': None})
+    assert list(df['date']) == [pd.Timestamp('2021-01-02'), pd.Timestamp('2021-03-04')]
+
+def test_apply_transform_parse_date_timezone():
+    df = pd.DataFrame({'date': ['2021-01-01 10:00:00']})
+    df = apply_transform(df, 'date', {
+        'type': TransformType.PARSE_DATE,
+        'format': '%Y-%m-%d %H:%M:%S',
+        'timezone': 'Asia/Bangkok'
+    })
+    assert df['date'].iloc[0] == pd.Timestamp('2021-01-01 17:00:00', tz='Asia/Bangkok')
+
 # Test apply_validation
 def test_apply_validation_required(sample_df):
     warnings = apply_validation(sample_df.copy(), 'name', {'type': 'required'})
@@ -118,6 +144,44 @@ def test_apply_validation_regex(sample_df):
     assert len(warnings) == 1
     assert "don't match pattern" in warnings[0].lower()
 
+@pytest.mark.parametrize("dtype", [object, "string[pyarrow]"])
+def test_apply_validation_regex_unicode_classes(dtype):
+    df = pd.DataFrame({'word': pd.Series(['café', 'สวัสดี', 'abc', '١٢٣'], dtype=dtype)})
+    # Thai vowel signs are combining marks, which \w doesn't match in Python's re either
+    warnings = apply_validation(df, 'word', {'type': 'regex', 'pattern': r'\w+$'})
+    assert len(warnings) == 1
+    assert "has 1 values" in warnings[0]
+    
+    warnings = apply_validation(df, 'word', {'type': 'regex', 'pattern': r'\d+$'})
+    assert len(warnings) == 1
+    assert "has 3 values" in warnings[0]
+
+@pytest.mark.parametrize("dtype", [object, "string[pyarrow]"])
+@pytest.mark.parametrize("pattern", [r'[a-z]+', r'\w+'])
+def test_apply_validation_regex_counts_missing_values(dtype, pattern):
+    df = pd.DataFrame({'word': pd.Series(['abc', None, 'def'], dtype=dtype)})
+    warnings = apply_validation(df, 'word', {'type': 'regex', 'pattern': pattern})
+    assert len(warnings) == 1
+    assert "has 1 values" in warnings[0]
+
+@pytest.mark.parametrize("dtype", [object, "string[pyarrow]"])
+def test_apply_validation_regex_posix_class(dtype):
+    # Python's re reads [[:alpha:]] as a bracket set followed by a literal ']'
+    df = pd.DataFrame({'word': pd.Series(['abc', 'a]'], dtype=dtype)})
+    warnings = apply_validation(df, 'word', {'type': 'regex', 'pattern': '[[:alpha:]]+'})
+    assert len(warnings) == 1
+    assert "has 1 values" in warnings[0]
+
+@pytest.mark.parametrize("dtype", [object, "string[pyarrow]"])
+def test_apply_transform_replace_unicode_classes(dtype):
+    df = pd.DataFrame({'word': pd.Series(['café', 'สวัสดี'], dtype=dtype)})
+    df = apply_transform(df, 'word', {
+        'type': TransformType.REPLACE,
+        'pattern': r'\w',
+        'replacement': 'x'
+    })
+    assert list(df['word']) == ['xxxx', 'xxัxxี']
+
 # Test apply_outlier_detection
 def test_apply_outlier_detection_iqr_cap(sample_df):
     df = apply_dtype(sample_df.copy(), 'score', ColumnDType.FLOAT)
@@ -128,6 +192,19 @@ def test_apply_outlier_detection_iqr_cap(sample_df):
     })
     assert df['score'].iloc[2] < 100  # Outlier should be capped
 
+@pytest.mark.parametrize('method', [OutlierMethod.IQR, OutlierMethod.ZSCORE])
+def test_apply_outlier_detection_cap_keeps_integers(method):
+    values = [10, 11, 12, 11, 10, 12, 11, 10, 12, 11, 10, 12, 11, 10, 12, 11, 10, 12, 11, 90]
+    df = pd.DataFrame({'score': values})
+    df = apply_outlier_detection(df, {
+        'method': method,
+        'columns': ['score'],
+        'action': OutlierAction.CAP
+    })
+    assert df['score'].dtype == np.int64
+    assert df['score'].iloc[:-1].tolist() == values[:-1]
+    assert df['score'].iloc[-1] < 90
+
 def test_apply_outlier_detection_zscore_remove(sample_df):
     df = apply_dtype(sample_df.copy(), 'score', ColumnDType.FLOAT)
     df = apply_outlier_detection(df, {